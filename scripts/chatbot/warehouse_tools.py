@@ -112,15 +112,14 @@ def execute_pending_query(query_id: str) -> str:
 
     try:
         with get_chatbot_snowflake_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(pq.sql)
-            results = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
+            with conn.cursor() as cursor:
+                cursor.execute(pq.sql)
+                # Arrow result batches converted column-wise; avoids building a tuple per row
+                df = cursor.fetch_pandas_all()
 
-            if not results:
+            if df.empty:
                 return "Query executed successfully but returned no rows."
 
-            df = pd.DataFrame(results, columns=columns)
             return df.to_json(orient="records", date_format="iso")
     except Exception as e:
         return f"Error executing query: {str(e)}"
@@ -4,18 +4,22 @@ Generates realistic transaction data with customer demographics, transaction det
 """
 
 import os
+import numpy as np
 import pandas as pd
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Tuple
-import uuid
 
 from prefect import flow, task, get_run_logger
 from prefect.variables import Variable
 from dotenv import load_dotenv
 from faker import Faker
 from scripts.utils.date_utils import get_canonical_data_date
+from scripts.utils import faker_pool
+from scripts.utils.faker_pool import (
+    cumulative_weights, fake_value, fake_values, personal_email, random_hex_ids, random_uuids, weighted_choice,
+)
 
 # Load environment variables
 load_dotenv()
@@ -23,6 +27,19 @@ load_dotenv()
 # Initialize Faker
 fake = Faker()
 
+# Set PIPE_SEED for reproducible runs (0 = fresh OS entropy). Each generator task gets
+# its own PCG64 stream because the stock and crypto tasks run concurrently and a
+# numpy Generator is not thread-safe; IDs are drawn from these streams too. Faker,
+# the Faker pools and the remaining stdlib draws are seeded from the same value.
+PIPE_SEED = int(os.getenv('PIPE_SEED', '0'))
+_CORPORATE_RNG, _CUSTOMER_RNG, _STOCK_RNG, _CRYPTO_RNG = (
+    np.random.default_rng(seed) for seed in np.random.SeedSequence(PIPE_SEED or None).spawn(4)
+)
+_random = random.Random(PIPE_SEED or None)
+if PIPE_SEED:
+    fake.seed_instance(PIPE_SEED)
+    faker_pool.seed(PIPE_SEED)
+
 # Configuration
 LOCAL_DATA_DIR = Path("data")
 STOCKLIST_PATH = Path("seeds/stocklist.txt")
@@ -42,6 +59,21 @@ CUSTOMER_AGE_GROUPS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
 
 # Company types
 COMPANY_TYPES = ['LLC', 'PUBLIC', 'PRIVATE']
+COMPANY_TYPE_WEIGHTS = np.array([50, 20, 30], dtype=float)
+
+# Corporate countries with realistic distribution
+CORPORATE_COUNTRIES = ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH']
+CORPORATE_COUNTRY_WEIGHTS = np.array([60, 10, 8, 5, 4, 4, 3, 2, 2, 2], dtype=float)
+
+# Cumulative weight tables for the per-customer weighted_choice draws
+CUSTOMER_TYPES = ['PERSONAL', 'CORPORATE']
+CUSTOMER_TYPE_CUM_WEIGHTS = cumulative_weights([80, 20])
+CUSTOMER_GENDER_CUM_WEIGHTS = cumulative_weights([49, 49, 2])
+COUNTRY_CUM_WEIGHTS = cumulative_weights([60, 10, 8, 5, 4, 4, 3, 2, 2, 2])
+CUSTOMER_TIERS = ['Bronze', 'Silver', 'Gold', 'Platinum']
+CUSTOMER_TIER_CUM_WEIGHTS = cumulative_weights([40, 30, 20, 10])
+RISK_TOLERANCES = ['Conservative', 'Moderate', 'Aggressive']
+RISK_TOLERANCE_CUM_WEIGHTS = cumulative_weights([30, 50, 20])
 
 # Price ranges for different asset types (approximate current values)
 STOCK_PRICE_RANGES = {
@@ -94,11 +126,11 @@ CRYPTO_PRICE_RANGES = {
 def get_unit_price(symbol: str, asset_type: str) -> float:
     if asset_type == "STOCK":
         low, high = STOCK_PRICE_RANGES[symbol]
-        return round(random.uniform(low, high), 2)
+        return round(_random.uniform(low, high), 2)
     elif asset_type == "CRYPTO":
         low, high = CRYPTO_PRICE_RANGES[symbol]
         # crypto prices can be more granular
-        return round(random.uniform(low, high), 6)
+        return round(_random.uniform(low, high), 6)
     else:
         raise ValueError("Unknown asset type")
 
@@ -133,58 +165,54 @@ def generate_corporate_demographics(num_corporates: int = 200) -> pd.DataFrame:
     """Generate corporate/company demographic data using Faker."""
     logger = get_run_logger()
     
-    corporates = []
+    rng = _CORPORATE_RNG
     
-    for i in range(num_corporates):
-        # Generate company name
-        company_name = fake.company()
-        
-        # Generate company type (LLC, PUBLIC, PRIVATE)
-        company_type = random.choices(COMPANY_TYPES, weights=[50, 20, 30])[0]
-        
-        # Generate country with realistic distribution
-        country = random.choices(
-            ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH'],
-            weights=[60, 10, 8, 5, 4, 4, 3, 2, 2, 2]
-        )[0]
-        
-        # Generate year founded (between 1950 and 2020)
-        year_founded = fake.random_int(min=1950, max=2020)
-        
-        # Generate tax number (EIN/TIN format varies by country)
-        if country == 'US':
-            # US EIN format: XX-XXXXXXX
-            tax_number = f"{fake.random_int(10, 99)}-{fake.random_int(1000000, 9999999)}"
-        elif country in ['CA', 'UK', 'AU']:
-            # Format: XXXXXXXXX
-            tax_number = str(fake.random_int(100000000, 999999999))
-        else:
-            # European format: XX.XXX.XXX/XXXX-XX
-            tax_number = f"{fake.random_int(10, 99)}.{fake.random_int(100, 999)}.{fake.random_int(100, 999)}/{fake.random_int(1000, 9999)}-{fake.random_int(10, 99)}"
-        
-        # Generate primary office location
-        office_location = fake.address().replace('\n', ', ')
-        
-        # Generate company email
-        company_email = f"info@{fake.domain_name()}"
-        
-        # Generate company ID
-        company_id = str(uuid.uuid4().hex[:12].upper())
-        
-        corporate = {
-            'company_id': company_id,
-            'company_name': company_name,
-            'company_type': company_type,
-            'company_email': company_email,
-            'country': country,
-            'year_founded': year_founded,
-            'tax_number': tax_number,
-            'office_primary_location': office_location,
-            'registration_date': fake.date_between(start_date='-10y', end_date='today').strftime('%Y-%m-%d')
-        }
-        corporates.append(corporate)
+    # Categorical columns drawn for the whole batch in one call each
+    company_types = rng.choice(COMPANY_TYPES, p=COMPANY_TYPE_WEIGHTS / COMPANY_TYPE_WEIGHTS.sum(), size=num_corporates)
+    countries = rng.choice(CORPORATE_COUNTRIES, p=CORPORATE_COUNTRY_WEIGHTS / CORPORATE_COUNTRY_WEIGHTS.sum(), size=num_corporates)
+    
+    # Year founded (between 1950 and 2020)
+    years_founded = rng.integers(1950, 2021, size=num_corporates)
+    
+    # Tax number digit groups for every row; the country picks the format below
+    tax_a = rng.integers(10, 100, size=num_corporates)
+    tax_b = rng.integers(1000000, 10000000, size=num_corporates)
+    tax_c = rng.integers(100000000, 1000000000, size=num_corporates)
+    tax_d = rng.integers(100, 1000, size=(num_corporates, 2))
+    tax_e = rng.integers(1000, 10000, size=num_corporates)
+    tax_f = rng.integers(10, 100, size=num_corporates)
+    is_us = countries == 'US'
+    is_nine_digit = np.isin(countries, ['CA', 'UK', 'AU'])
+    tax_numbers = [
+        # US EIN format: XX-XXXXXXX
+        f"{a}-{b}" if us
+        # Format: XXXXXXXXX
+        else str(c) if nine_digit
+        # European format: XX.XXX.XXX/XXXX-XX
+        else f"{a}.{d1}.{d2}/{e}-{f}"
+        for us, nine_digit, a, b, c, (d1, d2), e, f in zip(
+            is_us.tolist(), is_nine_digit.tolist(), tax_a.tolist(), tax_b.tolist(),
+            tax_c.tolist(), tax_d.tolist(), tax_e.tolist(), tax_f.tolist(),
+        )
+    ]
+    
+    # Registration date within the last 10 years
+    registration_dates = (
+        pd.Timestamp.today().normalize()
+        - pd.to_timedelta(rng.integers(0, 3653, size=num_corporates), unit='D')
+    ).strftime('%Y-%m-%d')
     
-    df = pd.DataFrame(corporates)
+    df = pd.DataFrame({
+        'company_id': random_hex_ids(num_corporates, 12, rng),
+        'company_name': fake_values("company", num_corporates),
+        'company_type': company_types,
+        'company_email': [f"info@{domain}" for domain in fake_values("domain_name", num_corporates)],
+        'country': countries,
+        'year_founded': years_founded,
+        'tax_number': tax_numbers,
+        'office_primary_location': fake_values("address", num_corporates),
+        'registration_date': registration_dates,
+    })
     df['load_timestamp'] = datetime.now().isoformat()
     logger.info(f"Generated {len(df)} corporate records using Faker")
     logger.info(f"Corporate distribution by country: {df['country'].value_counts().head().to_dict()}")
@@ -198,20 +226,29 @@ def generate_customer_demographics(num_customers: int = 1000, corporates_df: pd.
     logger = get_run_logger()
     
     customers = []
+    # Plain records for the per-customer corporate pick: a list index instead of a
+    # pandas sample() + iloc Series build for every corporate customer
+    corporates = corporates_df.to_dict('records') if corporates_df is not None else []
     
     # Set seed for reproducible results (optional)
     # fake.seed(42)
     
+    customer_ids = random_hex_ids(num_customers, 10, _CUSTOMER_RNG)
+    # Registration date within the last 10 years, drawn for every row at once
+    registration_dates = (
+        pd.Timestamp.today().normalize()
+        - pd.to_timedelta(_CUSTOMER_RNG.integers(0, 3653, size=num_customers), unit='D')
+    ).strftime('%Y-%m-%d')
     for i in range(num_customers):
-        customer_type = random.choices(['PERSONAL', 'CORPORATE'], weights=[80, 20])[0]
+        customer_type = weighted_choice(CUSTOMER_TYPES, CUSTOMER_TYPE_CUM_WEIGHTS)
 
         company_id = None
         first_name = None
         last_name = None
         email = None
         # Generate realistic customer data using Faker
-        if customer_type == 'CORPORATE' and corporates_df is not None and len(corporates_df) > 0:
-            corp = corporates_df.sample(1).iloc[0]
+        if customer_type == 'CORPORATE' and corporates:
+            corp = _random.choice(corporates)
             customer_id=corp['company_id']
             company_id = corp['company_id']
             email = corp['company_email']
@@ -225,9 +262,9 @@ def generate_customer_demographics(num_customers: int = 1000, corporates_df: pd.
 
 
         else:
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            email = fake.email()
+            first_name = fake_value("first_name")
+            last_name = fake_value("last_name")
+            email = personal_email(first_name, last_name, customer_ids[i])
             # Generate more realistic age group based on actual age
             age = fake.random_int(min=18, max=80)
             if age <= 25:
@@ -244,15 +281,12 @@ def generate_customer_demographics(num_customers: int = 1000, corporates_df: pd.
                 age_group = '65+'
             
             # Generate gender with realistic distribution
-            gender = random.choices(['M', 'F', 'Other'], weights=[49, 49, 2])[0]
+            gender = weighted_choice(CUSTOMER_GENDERS, CUSTOMER_GENDER_CUM_WEIGHTS)
             
             # Generate country with realistic distribution (more US customers)
-            country = random.choices(
-                ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH'],
-                weights=[60, 10, 8, 5, 4, 4, 3, 2, 2, 2]
-            )[0]
-            registration_date= fake.date_between(start_date='-10y', end_date='today').strftime('%Y-%m-%d')
-            customer_id = str(uuid.uuid4().hex[:10].upper())
+            country = weighted_choice(CORPORATE_COUNTRIES, COUNTRY_CUM_WEIGHTS)
+            registration_date = registration_dates[i]
+            customer_id = customer_ids[i]
             company_id = None
         # Generate customer type (PERSONAL or CORPORATE)
         # Approximately 80% personal, 20% corporate
@@ -272,8 +306,8 @@ def generate_customer_demographics(num_customers: int = 1000, corporates_df: pd.
             'age_group': age_group,
             'country': country,
             'registration_date': registration_date,
-            'customer_tier': random.choices(['Bronze', 'Silver', 'Gold', 'Platinum'], weights=[40, 30, 20, 10])[0],
-            'risk_tolerance': random.choices(['Conservative', 'Moderate', 'Aggressive'], weights=[30, 50, 20])[0],
+            'customer_tier': weighted_choice(CUSTOMER_TIERS, CUSTOMER_TIER_CUM_WEIGHTS),
+            'risk_tolerance': weighted_choice(RISK_TOLERANCES, RISK_TOLERANCE_CUM_WEIGHTS),
             'customer_type': customer_type,
             'company_id': company_id
         }
@@ -289,6 +323,93 @@ def generate_customer_demographics(num_customers: int = 1000, corporates_df: pd.
 
 
 
+# Customer segments driving transaction sizes, in precedence order
+CUSTOMER_SEGMENTS = ['CORPORATE', 'GOLD_PLATINUM', 'SILVER', 'BRONZE']
+
+# Stock lot choices (x100 shares) and weights per customer segment
+STOCK_LOTS_BY_SEGMENT = {
+    'CORPORATE': ([1, 2, 5, 10, 20, 50], [10, 15, 25, 25, 15, 10]),  # 100 → 5000
+    'GOLD_PLATINUM': ([1, 2, 3, 5, 10], [25, 25, 20, 20, 10]),  # 100 → 1000
+    'SILVER': ([1, 2, 3, 5], [40, 30, 20, 10]),  # 100 → 500
+    'BRONZE': ([1, 2, 3], [60, 30, 10]),  # 100 → 300
+}
+
+# Crypto quantity ranges per customer segment: (btc/eth range, other coins range)
+CRYPTO_QUANTITY_BY_SEGMENT = {
+    'CORPORATE': ((1, 50), (1000, 100000)),
+    'GOLD_PLATINUM': ((0.1, 5), (100, 10000)),
+    'SILVER': ((0.01, 1), (10, 1000)),
+    'BRONZE': ((0.001, 0.1), (1, 100)),
+}
+
+
+def sample_transaction_customers(rng: np.random.Generator, customers_df: pd.DataFrame, n: int) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """Pick n customers (with replacement) in one indexing call and return them with
+    boolean masks for each CUSTOMER_SEGMENTS entry."""
+    customers = customers_df.iloc[rng.integers(0, len(customers_df), size=n)].reset_index(drop=True)
+    tiers = customers['customer_tier'].to_numpy()
+    corporate = customers['customer_type'].to_numpy() == 'CORPORATE'
+    gold_platinum = ~corporate & np.isin(tiers, ['Gold', 'Platinum'])
+    silver = ~corporate & ~gold_platinum & (tiers == 'Silver')
+    segments = {
+        'CORPORATE': corporate,
+        'GOLD_PLATINUM': gold_platinum,
+        'SILVER': silver,
+        'BRONZE': ~(corporate | gold_platinum | silver),
+    }
+    return customers, segments
+
+
+def random_timestamps(rng: np.random.Generator, start_date: datetime, end_date: datetime, n: int) -> pd.DatetimeIndex:
+    """n uniformly distributed timestamps between start_date and end_date,
+    drawn as int64 nanoseconds and converted to a DatetimeIndex in one call."""
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    # An empty range (days_back=0) yields start itself instead of failing with low >= high
+    values = rng.integers(start.value, max(end.value, start.value + 1), size=n)
+    if start.tz is None:
+        return pd.to_datetime(values, unit='ns')
+    return pd.to_datetime(values, unit='ns', utc=True).tz_convert(start.tz)
+
+
+def price_ranges(symbols: np.ndarray, ranges: Dict[str, Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Low/high price arrays for symbols, looking each distinct symbol up once."""
+    unique_symbols, inverse = np.unique(symbols, return_inverse=True)
+    # reshape keeps the (0, 2) shape for an empty batch
+    bounds = np.array([ranges[symbol] for symbol in unique_symbols], dtype=float).reshape(-1, 2)
+    return bounds[inverse, 0], bounds[inverse, 1]
+
+
+def transactions_frame(
+    transaction_ids: List[str],
+    customers: pd.DataFrame,
+    asset_type: str,
+    symbols: np.ndarray,
+    is_sell: np.ndarray,
+    quantity: np.ndarray,
+    price_per_unit: np.ndarray,
+    transaction_amount: np.ndarray,
+    fee_amount: np.ndarray,
+    timestamps: pd.DatetimeIndex,
+) -> pd.DataFrame:
+    """Assemble the transaction columns into the output DataFrame."""
+    return pd.DataFrame({
+        'transaction_id': transaction_ids,
+        'customer_id': customers['customer_id'].to_numpy(),
+        'asset_type': asset_type,
+        'asset_symbol': symbols,
+        'transaction_type': np.where(is_sell, 'SELL', 'BUY'),
+        'quantity': quantity,
+        'price_per_unit': price_per_unit,
+        'transaction_amount': transaction_amount,
+        'fee_amount': fee_amount,
+        'transaction_timestamp': timestamps.strftime('%Y-%m-%d %H:%M:%S'),
+        'data_date': timestamps.strftime('%Y-%m-%d'),
+        'customer_tier': customers['customer_tier'].to_numpy(),
+        'customer_risk_tolerance': customers['risk_tolerance'].to_numpy(),
+        'customer_type': customers['customer_type'].to_numpy(),
+    })
+
+
 @task(name="Generate Stock Transactions")
 def generate_stock_transactions(
     customers_df: pd.DataFrame,
@@ -304,85 +425,54 @@ def generate_stock_transactions(
     if end_date is None:
         end_date = datetime.now() - timedelta(days=1)
 
-    transactions = []
-
-    for _ in range(num_transactions):
-        customer = customers_df.sample(1).iloc[0]
-        ticker = random.choice(stock_tickers)
-        transaction_type = random.choice(TRANSACTION_TYPES)
-
-        # -------------------------------
-        # 1️⃣ Price per unit (market-based)
-        # -------------------------------
-        low, high = STOCK_PRICE_RANGES[ticker]
-        price_per_unit = round(random.uniform(low, high), 2)
-
-        # -------------------------------
-        # 2️⃣ Quantity (multiples of 100)
-        # -------------------------------
-        if customer['customer_type'] == 'CORPORATE':
-            lots = random.choices(
-                [1, 2, 5, 10, 20, 50],  # 100 → 5000
-                weights=[10, 15, 25, 25, 15, 10]
-            )[0]
-        elif customer['customer_tier'] in ['Gold', 'Platinum']:
-            lots = random.choices(
-                [1, 2, 3, 5, 10],  # 100 → 1000
-                weights=[25, 25, 20, 20, 10]
-            )[0]
-        elif customer['customer_tier'] == 'Silver':
-            lots = random.choices(
-                [1, 2, 3, 5],  # 100 → 500
-                weights=[40, 30, 20, 10]
-            )[0]
-        else:  # Bronze
-            lots = random.choices(
-                [1, 2, 3],  # 100 → 300
-                weights=[60, 30, 10]
-            )[0]
-
-        quantity = lots * 100
-
-        # SELL trades are often smaller
-        if transaction_type == 'SELL':
-            sell_lots = max(1, int(lots * random.uniform(0.5, 1.0)))
-            quantity = sell_lots * 100
-            price_per_unit *= random.uniform(0.995, 1.0)
-
-        # -------------------------------
-        # 3️⃣ Transaction amount (derived)
-        # -------------------------------
-        transaction_amount = round(quantity * price_per_unit, 2)
-
-        # -------------------------------
-        # 4️⃣ Fees (stocks: 0.1% – 1%)
-        # -------------------------------
-        fee_percentage = random.uniform(0.001, 0.01)
-        fee_amount = round(transaction_amount * fee_percentage, 2)
-
-        # -------------------------------
-        # 5️⃣ Timestamp
-        # -------------------------------
-        timestamp = fake.date_time_between(start_date=start_date, end_date=end_date)
-
-        transactions.append({
-            'transaction_id': str(uuid.uuid4()),
-            'customer_id': customer['customer_id'],
-            'asset_type': 'STOCK',
-            'asset_symbol': ticker,
-            'transaction_type': transaction_type,
-            'quantity': quantity,
-            'price_per_unit': round(price_per_unit, 2),
-            'transaction_amount': transaction_amount,
-            'fee_amount': fee_amount,
-            'transaction_timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'data_date': timestamp.strftime('%Y-%m-%d'),
-            'customer_tier': customer['customer_tier'],
-            'customer_risk_tolerance': customer['risk_tolerance'],
-            'customer_type': customer['customer_type']
-        })
-
-    df = pd.DataFrame(transactions)
+    # Every column is drawn for the whole batch at once
+    rng = _STOCK_RNG
+    n = num_transactions
+    customers, segments = sample_transaction_customers(rng, customers_df, n)
+    tickers = rng.choice(stock_tickers, size=n)
+    is_sell = rng.choice(TRANSACTION_TYPES, size=n) == 'SELL'
+
+    # -------------------------------
+    # 1️⃣ Price per unit (market-based)
+    # -------------------------------
+    low, high = price_ranges(tickers, STOCK_PRICE_RANGES)
+    price_per_unit = np.round(rng.uniform(low, high), 2)
+
+    # -------------------------------
+    # 2️⃣ Quantity (multiples of 100)
+    # -------------------------------
+    lots = np.empty(n, dtype=np.int64)
+    for segment, mask in segments.items():
+        choices, weights = STOCK_LOTS_BY_SEGMENT[segment]
+        weights = np.asarray(weights, dtype=float)
+        lots[mask] = rng.choice(choices, p=weights / weights.sum(), size=int(mask.sum()))
+
+    # SELL trades are often smaller
+    sell_lots = np.maximum(1, (lots * rng.uniform(0.5, 1.0, size=n)).astype(np.int64))
+    quantity = np.where(is_sell, sell_lots, lots) * 100
+    price_per_unit[is_sell] *= rng.uniform(0.995, 1.0, size=int(is_sell.sum()))
+
+    # -------------------------------
+    # 3️⃣ Transaction amount (derived)
+    # -------------------------------
+    transaction_amount = quantity * price_per_unit
+    np.round(transaction_amount, 2, out=transaction_amount)
+
+    # -------------------------------
+    # 4️⃣ Fees (stocks: 0.1% – 1%)
+    # -------------------------------
+    fee_amount = transaction_amount * rng.uniform(0.001, 0.01, size=n)
+    np.round(fee_amount, 2, out=fee_amount)
+
+    # -------------------------------
+    # 5️⃣ Timestamp
+    # -------------------------------
+    timestamps = random_timestamps(rng, start_date, end_date, n)
+
+    df = transactions_frame(
+        random_uuids(n, rng), customers, 'STOCK', tickers, is_sell,
+        quantity, np.round(price_per_unit, 2, out=price_per_unit), transaction_amount, fee_amount, timestamps,
+    )
     logger.info(f"Generated {len(df)} stock transaction records")
 
     return df
@@ -403,88 +493,62 @@ def generate_crypto_transactions(
     if end_date is None:
         end_date = datetime.now()
 
-    transactions = []
-
-    for _ in range(num_transactions):
-        customer = customers_df.sample(1).iloc[0]
-        symbol = random.choice(crypto_symbols).lower()
-        transaction_type = random.choice(TRANSACTION_TYPES)
+    # Every column is drawn for the whole batch at once
+    rng = _CRYPTO_RNG
+    n = num_transactions
+    customers, segments = sample_transaction_customers(rng, customers_df, n)
+    symbols = np.char.lower(rng.choice(crypto_symbols, size=n))
+    is_sell = rng.choice(TRANSACTION_TYPES, size=n) == 'SELL'
+
+    # -------------------------------
+    # 1️⃣ Price per unit (market-based)
+    # -------------------------------
+    low, high = price_ranges(symbols, CRYPTO_PRICE_RANGES)
+    price_per_unit = np.round(rng.uniform(low, high), 6)
+
+    # -------------------------------
+    # 2️⃣ Quantity (customer-driven)
+    # -------------------------------
+    is_major = np.isin(symbols, ['btc', 'eth'])
+    quantity = np.empty(n, dtype=float)
+    for segment, mask in segments.items():
+        (major_low, major_high), (other_low, other_high) = CRYPTO_QUANTITY_BY_SEGMENT[segment]
+        size = int(mask.sum())
+        quantity[mask] = np.where(
+            is_major[mask],
+            np.round(rng.uniform(major_low, major_high, size=size), 6),
+            np.round(rng.uniform(other_low, other_high, size=size), 2),
+        )
 
-        # -------------------------------
-        # 1️⃣ Price per unit (market-based)
-        # -------------------------------
-        low, high = CRYPTO_PRICE_RANGES[symbol]
-        price_per_unit = round(random.uniform(low, high), 6)
-
-        # -------------------------------
-        # 2️⃣ Quantity (customer-driven)
-        # -------------------------------
-        if customer['customer_type'] == 'CORPORATE':
-            quantity = (
-                round(random.uniform(1, 50), 6)
-                if symbol in ['btc', 'eth']
-                else round(random.uniform(1000, 100000), 2)
-            )
-        elif customer['customer_tier'] in ['Gold', 'Platinum']:
-            quantity = (
-                round(random.uniform(0.1, 5), 6)
-                if symbol in ['btc', 'eth']
-                else round(random.uniform(100, 10000), 2)
-            )
-        elif customer['customer_tier'] == 'Silver':
-            quantity = (
-                round(random.uniform(0.01, 1), 6)
-                if symbol in ['btc', 'eth']
-                else round(random.uniform(10, 1000), 2)
-            )
-        else:  # Bronze
-            quantity = (
-                round(random.uniform(0.001, 0.1), 6)
-                if symbol in ['btc', 'eth']
-                else round(random.uniform(1, 100), 2)
-            )
-
-        # SELL transactions typically smaller & discounted
-        if transaction_type == 'SELL':
-            quantity *= random.uniform(0.5, 1.0)
-            price_per_unit *= random.uniform(0.995, 1.0)
-
-        quantity = round(max(quantity, 0.000001), 6)
-
-        # -------------------------------
-        # 3️⃣ Transaction amount (derived)
-        # -------------------------------
-        transaction_amount = round(quantity * price_per_unit, 2)
-
-        # -------------------------------
-        # 4️⃣ Fees (crypto usually 0.1–0.5%)
-        # -------------------------------
-        fee_percentage = random.uniform(0.001, 0.005)
-        fee_amount = round(transaction_amount * fee_percentage, 2)
-
-        # -------------------------------
-        # 5️⃣ Timestamp
-        # -------------------------------
-        timestamp = fake.date_time_between(start_date=start_date, end_date=end_date)
-
-        transactions.append({
-            'transaction_id': str(uuid.uuid4()),
-            'customer_id': customer['customer_id'],
-            'asset_type': 'CRYPTO',
-            'asset_symbol': symbol.upper(),
-            'transaction_type': transaction_type,
-            'quantity': quantity,
-            'price_per_unit': price_per_unit,
-            'transaction_amount': transaction_amount,
-            'fee_amount': fee_amount,
-            'transaction_timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'data_date': timestamp.strftime('%Y-%m-%d'),
-            'customer_tier': customer['customer_tier'],
-            'customer_risk_tolerance': customer['risk_tolerance'],
-            'customer_type': customer['customer_type']
-        })
-
-    df = pd.DataFrame(transactions)
+    # SELL transactions typically smaller & discounted
+    n_sell = int(is_sell.sum())
+    quantity[is_sell] *= rng.uniform(0.5, 1.0, size=n_sell)
+    price_per_unit[is_sell] *= rng.uniform(0.995, 1.0, size=n_sell)
+
+    np.maximum(quantity, 0.000001, out=quantity)
+    np.round(quantity, 6, out=quantity)
+
+    # -------------------------------
+    # 3️⃣ Transaction amount (derived)
+    # -------------------------------
+    transaction_amount = quantity * price_per_unit
+    np.round(transaction_amount, 2, out=transaction_amount)
+
+    # -------------------------------
+    # 4️⃣ Fees (crypto usually 0.1–0.5%)
+    # -------------------------------
+    fee_amount = transaction_amount * rng.uniform(0.001, 0.005, size=n)
+    np.round(fee_amount, 2, out=fee_amount)
+
+    # -------------------------------
+    # 5️⃣ Timestamp
+    # -------------------------------
+    timestamps = random_timestamps(rng, start_date, end_date, n)
+
+    df = transactions_frame(
+        random_uuids(n, rng), customers, 'CRYPTO', np.char.upper(symbols), is_sell,
+        quantity, price_per_unit, transaction_amount, fee_amount, timestamps,
+    )
     logger.info(f"Generated {len(df)} crypto transaction records")
 
     return df
@@ -617,15 +681,16 @@ def generate_fake_market_data_flow(
         # 3. Generate customer demographics (link corporate customers to corporates)
         customers_df = generate_customer_demographics(num_customers, corporates_df)
         
-        # 4. Generate stock transactions
-        stock_transactions_df = generate_stock_transactions(
+        # 4-5. Generate stock and crypto transactions concurrently: both only read
+        # customers_df and draw from their own numpy Generator
+        stock_future = generate_stock_transactions.submit(
             customers_df, stock_tickers, num_stock_transactions, start_date, end_date
         )
-        
-        # 5. Generate crypto transactions
-        crypto_transactions_df = generate_crypto_transactions(
+        crypto_future = generate_crypto_transactions.submit(
             customers_df, crypto_symbols, num_crypto_transactions, start_date, end_date
         )
+        stock_transactions_df = stock_future.result()
+        crypto_transactions_df = crypto_future.result()
         
         # 6. Combine and clean data, split by customer type
         personal_transactions_df, corporate_transactions_df = combine_transaction_data(
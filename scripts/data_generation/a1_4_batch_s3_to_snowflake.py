@@ -153,15 +153,6 @@ def _sf_stage_name() -> str:
     return f"{SNOWFLAKE_SCHEMA_STAGING}.{SNOWFLAKE_STAGE_STAGING}"
 
 
-def _escape_stage_pattern(file_name: str) -> str:
-    """Build a Snowflake regex PATTERN that matches the staged file, with optional .gz suffix."""
-    # Snowflake PATTERN uses regex; escape the filename and allow optional .gz from AUTO_COMPRESS
-    escaped = re.escape(file_name)
-    # re.escape uses backslashes; ensure they survive SQL string literal
-    escaped = escaped.replace("\\", "\\\\")
-    return f".*{escaped}(\\\\.gz)?$"
-
-
 def _infer_run_ts_yyyymmddhhmmss(file_name: str) -> Optional[str]:
     """Infer canonical run timestamp from filenames like *_YYYYMMDD_HHMMSS.csv."""
     m = re.search(r"_(\d{8})_(\d{6})\.csv$", file_name)
@@ -370,7 +361,8 @@ def _temp_table_name(file_type: str, file_name: str) -> str:
 
 
 def _copy_into_temp_sql(file_type: str, temp_table_unqualified: str, file_name: str) -> str:
-    """COPY INTO temp table using stage PATTERN (handles .gz)."""
+    """COPY INTO temp table from the exact staged file (FILES, no stage listing). The
+    file is left on the stage so a failed MERGE can be retried; see _remove_staged_file_sql."""
     cols = FILE_TYPE_TO_COLUMNS[file_type]
 
     # Build SELECT list in positional order, with type casts.
@@ -451,7 +443,7 @@ def _copy_into_temp_sql(file_type: str, temp_table_unqualified: str, file_name:
         raise ValueError(f"Unsupported file_type: {file_type}")
 
     stage = _sf_stage_name()
-    pattern = _escape_stage_pattern(file_name)
+    staged_name = sf_utils.staged_file_name(file_name).replace("'", "''")
 
     return f"""
     COPY INTO {temp_table_unqualified}
@@ -460,13 +452,19 @@ def _copy_into_temp_sql(file_type: str, temp_table_unqualified: str, file_name:
         SELECT
             {", ".join(select_exprs)}
         FROM @{stage}
-        (PATTERN => '{pattern}')
     )
+    FILES = ('{staged_name}')
     FILE_FORMAT = (TYPE = CSV, SKIP_HEADER = 1, FIELD_OPTIONALLY_ENCLOSED_BY='"')
     ON_ERROR = 'CONTINUE';
     """
 
 
+def _remove_staged_file_sql(file_name: str) -> str:
+    """REMOVE the staged file; only issued once its MERGE has succeeded."""
+    staged_name = sf_utils.staged_file_name(file_name).replace("'", "''")
+    return f"REMOVE '@{_sf_stage_name()}/{staged_name}';"
+
+
 def _merge_sql(file_type: str, temp_table_unqualified: str) -> str:
     target_table = _sf_full_table_name(FILE_TYPE_TO_TARGET_TABLE[file_type])
     merge_keys = FILE_TYPE_TO_MERGE_KEYS[file_type]
@@ -573,22 +571,30 @@ def load_staged_file_into_snowflake_raw(file_type: str, file_name: str) -> bool:
 
     # Use a single connection/session so TEMP table exists for COPY+MERGE.
     try:
-        with sf_utils.get_snowflake_connection() as conn:
-            cur = conn.cursor()
-
+        with sf_utils.get_snowflake_connection() as conn, conn.cursor() as cur:
             # Create TEMP table with same structure as target
             target_full = _sf_full_table_name(FILE_TYPE_TO_TARGET_TABLE[file_type])
             cur.execute(f"CREATE OR REPLACE TEMP TABLE {temp_table} LIKE {target_full};")
 
-            # COPY file from stage into temp
-            copy_sql = _copy_into_temp_sql(file_type, temp_table, file_name)
-            logger.info(f"Executing COPY for {file_type} from stage file {file_name}")
-            cur.execute(copy_sql)
-
-            # MERGE from temp into target
-            merge_sql = _merge_sql(file_type, temp_table)
-            logger.info(f"Executing MERGE for {file_type} into {target_full}")
-            cur.execute(merge_sql)
+            try:
+                # COPY file from stage into temp
+                copy_sql = _copy_into_temp_sql(file_type, temp_table, file_name)
+                logger.info(f"Executing COPY for {file_type} from stage file {file_name}")
+                cur.execute(copy_sql)
+
+                # MERGE from temp into target
+                merge_sql = _merge_sql(file_type, temp_table)
+                logger.info(f"Executing MERGE for {file_type} into {target_full}")
+                cur.execute(merge_sql)
+
+                # The rows are merged, so the staged copy is no longer needed for a retry
+                try:
+                    cur.execute(_remove_staged_file_sql(file_name))
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not remove staged file {file_name}: {e}")
+            finally:
+                # The session may be a run-wide warm one, so do not leave the temp table behind
+                cur.execute(f"DROP TABLE IF EXISTS {temp_table};")
 
         logger.info(f"✅ Loaded {file_name} into {target_full} via MERGE")
         return True
@@ -57,17 +57,17 @@ def load_crypto_list() -> List[str]:
 def build_output_filename(source: str, data_date: Optional[str] = None) -> Path:
     dd = get_canonical_data_date(data_date)
     fname = f"crypto_{source}_{dd}.csv"
-    return LOCAL_DATA_DIR / fname
+    # Namespace per source and run so concurrent subflows never share a directory
+    return LOCAL_DATA_DIR / source / dd / fname
 
 
 @task(name="Save Source Data to CSV")
 def save_source_csv(df: pd.DataFrame, source: str, data_date: Optional[str] = None) -> Path:
-    """Save DataFrame to data/crypto_{source}_{data_date}.csv.
+    """Save DataFrame to data/{source}/{data_date}/crypto_{source}_{data_date}.csv.
     Required columns for all sources:
       symbol, base_currency, quote_currency, price, volume, source, observed_at
     """
     logger = get_run_logger()
-    LOCAL_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     # Ensure required columns exist
     required = [
@@ -79,6 +79,7 @@ def save_source_csv(df: pd.DataFrame, source: str, data_date: Optional[str] = No
     df = df[required]
 
     out_path = build_output_filename(source, data_date)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(out_path, index=False, encoding="utf-8")
     logger.info(f"Saved {len(df)} {source} rows to {out_path}")
     return out_path
@@ -2,21 +2,27 @@
 Prefect flow: Fetch latest crypto prices from Binance, CSV -> MinIO -> Snowflake stage -> Postgres
 - Reads cryptos from seeds/cryptolist.txt
 - Pairs with USD (uses USDT market as proxy), captures price and 24h volume
-- Writes data/crypto_binance_{data_date}.csv (data_date from scripts.utils.date_utils.get_canonical_data_date)
+- Writes data/binance/{data_date}/crypto_binance_{data_date}.csv (data_date from scripts.utils.date_utils.get_canonical_data_date)
 - Uploads to MinIO and Snowflake stage only (no table COPY)
 - Loads CSV rows into local Postgres table raw_cryptoprices_binance
 """
 from __future__ import annotations
 
+import json
 import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import requests
 from dotenv import load_dotenv
 from prefect import flow, task, get_run_logger
+from prefect.tasks import exponential_backoff
 
 from scripts.data_generation.a2_0_crypto_common import (
     load_crypto_list,
@@ -32,16 +38,141 @@ load_dotenv()
 
 BINANCE_URL = os.getenv("BINANCE_URL", "https://api.binance.com/api/v3")
 
-
-@task(name="Fetch Binance Prices")
+# Fixed output schema so pandas does not need to infer dtypes row by row
+BINANCE_COLUMNS = ["symbol", "base_currency", "quote_currency", "price", "volume", "source", "observed_at"]
+BINANCE_DTYPES = {
+    "symbol": "string",
+    "base_currency": "string",
+    "quote_currency": "string",
+    "price": "float64",
+    "volume": "float64",
+    "source": "string",
+    "observed_at": "datetime64[ns]",
+}
+
+# In-process TTL cache for /ticker/24hr payloads, shared by concurrent tasks in one worker
+TICKER_CACHE_TTL_SECONDS = int(os.getenv("BINANCE_TICKER_CACHE_TTL", "30"))
+_ticker_cache: dict[tuple[str, Optional[str]], tuple[float, list, datetime]] = {}
+_ticker_cache_lock = threading.Lock()
+# On-disk cache of raw responses keyed by minute bucket: reruns within the same minute skip
+# the network, and the latest bucket is served if Binance throttles or is unreachable, as long
+# as it is no older than TICKER_STALE_MAX_AGE_SECONDS
+TICKER_DISK_CACHE_PATH = Path(os.getenv("BINANCE_TICKER_DISK_CACHE", ".cache/binance.sqlite"))
+TICKER_STALE_MAX_AGE_SECONDS = int(os.getenv("BINANCE_TICKER_STALE_MAX_AGE", "300"))
+_BUCKET_FORMAT = "%Y%m%d%H%M"
+_FALLBACK_STATUS_CODES = {418, 429, 500, 502, 503, 504}
+# USDT pairs seen in the last full-market ticker, used to keep batched symbol requests valid
+_listed_usdt_symbols: set[str] = set()
+
+
+def _disk_cache() -> sqlite3.Connection:
+    TICKER_DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(TICKER_DISK_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ticker (cache_key TEXT, bucket TEXT, payload TEXT, "
+        "PRIMARY KEY (cache_key, bucket))"
+    )
+    return conn
+
+
+def _disk_cache_get(cache_key: str, bucket: Optional[str]) -> Optional[tuple[list, datetime]]:
+    """Return (payload, bucket time) for bucket, or for the most recent one if bucket is None."""
+    with closing(_disk_cache()) as conn:
+        if bucket:
+            row = conn.execute(
+                "SELECT payload, bucket FROM ticker WHERE cache_key = ? AND bucket = ?", (cache_key, bucket)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT payload, bucket FROM ticker WHERE cache_key = ? ORDER BY bucket DESC LIMIT 1",
+                (cache_key,),
+            ).fetchone()
+    return (json.loads(row[0]), datetime.strptime(row[1], _BUCKET_FORMAT)) if row else None
+
+
+def _disk_cache_put(cache_key: str, bucket: str, data: list) -> None:
+    with closing(_disk_cache()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO ticker (cache_key, bucket, payload) VALUES (?, ?, ?)",
+            (cache_key, bucket, json.dumps(data)),
+        )
+        # Keep only the latest bucket per request
+        conn.execute("DELETE FROM ticker WHERE cache_key = ? AND bucket < ?", (cache_key, bucket))
+
+
+def _fetch_binance_raw(url: str, symbols: Optional[str] = None) -> tuple[list, datetime]:
+    """Return the parsed JSON list for url (optionally restricted to a JSON array of
+    symbols) and the time it was fetched, reusing a response younger than the TTL.
+
+    If Binance throttles or is unreachable, the latest cached response is served
+    only if it is younger than TICKER_STALE_MAX_AGE_SECONDS; otherwise the error
+    is raised so the task's retries kick in.
+
+    The lock is held across the request so that concurrent callers on a cold
+    cache wait for a single round trip instead of all hitting Binance.
+    """
+    key = (url, symbols)
+    with _ticker_cache_lock:
+        cached = _ticker_cache.get(key)
+        if cached and time.monotonic() - cached[0] < TICKER_CACHE_TTL_SECONDS:
+            return cached[1], cached[2]
+
+        cache_key = f"{url}?symbols={symbols or ''}"
+        now = datetime.now()
+        bucket = now.strftime(_BUCKET_FORMAT)
+        hit = _disk_cache_get(cache_key, bucket)
+        if hit is not None:
+            data, fetched_at = hit
+        else:
+            try:
+                params = {"symbols": symbols} if symbols else None
+                resp = requests.get(url, params=params, timeout=30)
+                resp.raise_for_status()
+                data, fetched_at = resp.json(), now
+            except requests.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                stale = _disk_cache_get(cache_key, None) if status in _FALLBACK_STATUS_CODES or status is None else None
+                if stale is None or (now - stale[1]).total_seconds() > TICKER_STALE_MAX_AGE_SECONDS:
+                    raise
+                data, fetched_at = stale
+                get_run_logger().warning(f"Binance unavailable ({e}); serving ticker cached at {fetched_at:%H:%M}")
+            else:
+                _disk_cache_put(cache_key, bucket, data)
+
+        _ticker_cache[key] = (time.monotonic(), data, fetched_at)
+        return data, fetched_at
+
+
+# Retry transient 429/5xx errors with jittered exponential backoff so concurrent runs do not retry in lockstep
+@task(
+    name="Fetch Binance Prices",
+    retries=5,
+    retry_delay_seconds=exponential_backoff(backoff_factor=2),
+    retry_jitter_factor=1.0,
+)
 def fetch_binance(cryptos: List[str]) -> pd.DataFrame:
     logger = get_run_logger()
     rows = []
     try:
-        resp = requests.get(f"{BINANCE_URL}/ticker/24hr", timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
-        now_iso = datetime.now().isoformat()
+        # Ask only for the USDT pairs we track instead of the full ~2000-symbol market
+        wanted = [f"{c.upper()}USDT" for c in cryptos]
+        if _listed_usdt_symbols:
+            wanted = [s for s in wanted if s in _listed_usdt_symbols]
+        # An empty list would be sent as symbols=[] and rejected; ask for the full market instead
+        symbols = json.dumps(wanted, separators=(",", ":")) if wanted else None
+        try:
+            data, fetched_at = _fetch_binance_raw(f"{BINANCE_URL}/ticker/24hr", symbols)
+        except requests.HTTPError as e:
+            # Binance rejects the whole batch with 400 if any symbol is not listed
+            if e.response is None or e.response.status_code != 400:
+                raise
+            logger.warning("Some symbols are not listed on Binance; falling back to the full 24hr ticker")
+            data, fetched_at = _fetch_binance_raw(f"{BINANCE_URL}/ticker/24hr")
+            _listed_usdt_symbols.update(
+                t.get("symbol", "") for t in data if t.get("symbol", "").endswith("USDT")
+            )
+        # Stamp rows with when the ticker was fetched, which is earlier than now if a cached one was served
+        observed_at = fetched_at.isoformat()
         for t in data:
             symbol = t.get("symbol", "")
             # Prefer USDT market as proxy for USD
@@ -57,17 +188,17 @@ def fetch_binance(cryptos: List[str]) -> pd.DataFrame:
                         "price": price,
                         "volume": volume,
                         "source": "binance",
-                        "observed_at": now_iso,
+                        "observed_at": observed_at,
                     })
         logger.info(f"Fetched {len(rows)} Binance rows")
     except Exception as e:
         logger.error(f"Binance fetch error: {e}")
         raise
-    return pd.DataFrame(rows)
+    return pd.DataFrame.from_records(rows, columns=BINANCE_COLUMNS).astype(BINANCE_DTYPES)
 
 
 @flow(name="a2_crypto_prices__binance")
-def crypto_prices_binance_flow() -> Path:
+def crypto_prices_binance_flow(data_date: Optional[str] = None) -> Path:
     logger = get_run_logger()
     logger.info("🚀 Start Binance crypto prices flow")
 
@@ -77,7 +208,7 @@ def crypto_prices_binance_flow() -> Path:
     if df.empty:
         raise ValueError("No Binance data returned")
 
-    csv_path = save_source_csv(df, source="binance")
+    csv_path = save_source_csv(df, source="binance", data_date=data_date)
 
     ok = upload_minio_and_stage(csv_path, source="binance")
     if not ok:
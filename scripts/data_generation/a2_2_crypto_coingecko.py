@@ -2,7 +2,7 @@
 Prefect flow: Fetch latest crypto prices from CoinGecko, CSV -> MinIO -> Snowflake stage -> Postgres
 - Reads cryptos from seeds/cryptolist.txt
 - Uses /simple/price with vs_currency=usd to get price and 24h volume
-- Writes data/crypto_coingecko_{data_date}.csv
+- Writes data/coingecko/{data_date}/crypto_coingecko_{data_date}.csv
 - Uploads to MinIO and stages file to Snowflake
 - Loads CSV rows into local Postgres table raw_cryptoprices_coingecko
 """
@@ -12,7 +12,7 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import requests
@@ -79,7 +79,7 @@ def fetch_coingecko(cryptos: List[str]) -> pd.DataFrame:
 
 
 @flow(name="a2_crypto_prices__coingecko")
-def crypto_prices_coingecko_flow() -> Path:
+def crypto_prices_coingecko_flow(data_date: Optional[str] = None) -> Path:
     logger = get_run_logger()
     logger.info("🚀 Start CoinGecko crypto prices flow")
 
@@ -89,7 +89,7 @@ def crypto_prices_coingecko_flow() -> Path:
     if df.empty:
         raise ValueError("No CoinGecko data returned")
 
-    csv_path = save_source_csv(df, source="coingecko")
+    csv_path = save_source_csv(df, source="coingecko", data_date=data_date)
 
     ok = upload_minio_and_stage(csv_path, source="coingecko")
     if not ok:
@@ -4,7 +4,7 @@ CSV -> MinIO -> Snowflake stage -> Postgres
 - Reads cryptos from seeds/cryptolist.txt
 - Queries tickers as BASE-USD (e.g., BTC-USD)
 - Uses most recent bar from 1d/1m history as spot proxy; volume from same bar
-- Writes data/crypto_yfinance_{data_date}.csv
+- Writes data/yfinance/{data_date}/crypto_yfinance_{data_date}.csv
 - Uploads to MinIO and stages file to Snowflake
 - Loads CSV rows into local Postgres table raw_cryptoprices_yfinance
 """
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import yfinance as yf
@@ -72,7 +72,7 @@ def fetch_yfinance(cryptos: List[str]) -> pd.DataFrame:
 
 
 @flow(name="a2_crypto_prices__yfinance")
-def crypto_prices_yfinance_flow() -> Path:
+def crypto_prices_yfinance_flow(data_date: Optional[str] = None) -> Path:
     logger = get_run_logger()
     logger.info("🚀 Start yfinance crypto prices flow")
 
@@ -82,7 +82,7 @@ def crypto_prices_yfinance_flow() -> Path:
     if df.empty:
         raise ValueError("No yfinance data returned")
 
-    csv_path = save_source_csv(df, source="yfinance")
+    csv_path = save_source_csv(df, source="yfinance", data_date=data_date)
 
     ok = upload_minio_and_stage(csv_path, source="yfinance")
     if not ok:
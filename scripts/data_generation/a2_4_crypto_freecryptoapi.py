@@ -133,7 +133,7 @@ def fetch_freecryptoapi(cryptos: List[str]) -> pd.DataFrame:
 
 
 @flow(name="a2_crypto_prices__freecryptoapi")
-def crypto_prices_freecryptoapi_flow() -> Path:
+def crypto_prices_freecryptoapi_flow(data_date: Optional[str] = None) -> Path:
     logger = get_run_logger()
     logger.info("🚀 Start FreeCryptoAPI crypto prices flow")
 
@@ -145,10 +145,10 @@ def crypto_prices_freecryptoapi_flow() -> Path:
         # Still create an empty CSV to mark run
         csv_path = save_source_csv(pd.DataFrame(columns=[
             "symbol", "base_currency", "quote_currency", "price", "volume", "source", "observed_at"
-        ]), source="freecryptoapi")
+        ]), source="freecryptoapi", data_date=data_date)
         return csv_path
 
-    csv_path = save_source_csv(df, source="freecryptoapi")
+    csv_path = save_source_csv(df, source="freecryptoapi", data_date=data_date)
 
     ok = upload_minio_and_stage(csv_path, source="freecryptoapi")
     if not ok:
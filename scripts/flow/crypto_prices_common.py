@@ -15,6 +15,8 @@ from datetime import datetime
 
 import pandas as pd
 import psycopg2
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from dotenv import load_dotenv
 from prefect import task, get_run_logger
 
@@ -56,17 +58,17 @@ def load_crypto_list() -> List[str]:
 def build_output_filename(source: str, data_date: Optional[str] = None) -> Path:
     dd = get_canonical_data_date(data_date)
     fname = f"crypto_{source}_{dd}.csv"
-    return LOCAL_DATA_DIR / fname
+    # Namespace per source and run so concurrent subflows never share a directory
+    return LOCAL_DATA_DIR / source / dd / fname
 
 
 @task(name="Save Source Data to CSV")
 def save_source_csv(df: pd.DataFrame, source: str, data_date: Optional[str] = None) -> Path:
-    """Save DataFrame to data/crypto_{source}_{data_date}.csv.
+    """Save DataFrame to data/{source}/{data_date}/crypto_{source}_{data_date}.csv.
     Required columns for all sources:
       symbol, base_currency, quote_currency, price, volume, source, observed_at
     """
     logger = get_run_logger()
-    LOCAL_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     # Ensure required columns exist
     required = [
@@ -78,7 +80,10 @@ def save_source_csv(df: pd.DataFrame, source: str, data_date: Optional[str] = No
     df = df[required]
 
     out_path = build_output_filename(source, data_date)
-    df.to_csv(out_path, index=False, encoding="utf-8")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # pyarrow's native CSV writer avoids pandas' per-row Python formatting path
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pa_csv.write_csv(table, out_path, write_options=pa_csv.WriteOptions(include_header=True))
     logger.info(f"Saved {len(df)} {source} rows to {out_path}")
     return out_path
 
@@ -149,13 +154,14 @@ def load_csv_to_postgres(csv_path: Path, source: str):
     """COPY CSV rows into raw_cryptoprices_{source}. Assumes header row present."""
     logger = get_run_logger()
     table = f"raw_cryptoprices_{source}"
+    columns = "(symbol, base_currency, quote_currency, price, volume, source, observed_at)"
     conn = None
     try:
         conn = _pg_conn()
         with conn.cursor() as cur:
-            with open(csv_path, "r") as f:
-                next(f)  # skip header
-                cur.copy_expert(f"COPY {table} FROM STDIN WITH CSV", f)
+            # Stream raw bytes; Postgres skips the header itself and load_timestamp takes its default
+            with open(csv_path, "rb") as f:
+                cur.copy_expert(f"COPY {table} {columns} FROM STDIN WITH (FORMAT csv, HEADER true)", f)
         conn.commit()
         logger.info(f"✅ Loaded {csv_path.name} into {table}")
     except Exception as e:
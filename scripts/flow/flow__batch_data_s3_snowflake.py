@@ -1,15 +1,46 @@
+import importlib
+
 from prefect import flow, get_run_logger
 from datetime import datetime
 
-# Subflows to orchestrate
-from scripts.data_generation.a1_1_raw_data_faker_generator import generate_fake_market_data_flow
-from scripts.data_generation.a1_2_news_data_scrapper import crypto_news_scraper
-from scripts.data_generation.a1_3_batch_data_to_s3 import data_to_s3_flow
-from scripts.data_generation.a1_4_batch_s3_to_snowflake import crypto_news_s3_to_snowflake_flow
-from scripts.data_generation.a1_5_batch_s3_to_postgres import batch_s3_to_postgres_flow
-from scripts.data_generation.a1_6_batch_dbt_build import run_dbt_build_after_staging
+from scripts.utils import snowflake_pool
 from scripts.utils.date_utils import get_canonical_data_date
 
+# Declarative step table: (result key, "module:subflow", enable flag parameter, upstream steps).
+# Order is topological (upstream steps come first); a step is skipped unless all of its
+# upstream steps ran and succeeded in this run.
+# Subflow modules are imported only when their step is enabled, so disabled steps never
+# pay for their heavy dependency trees (pandas, boto3, snowflake-connector, dbt, ...).
+STEPS = [
+    ("fake_market_data", "scripts.data_generation.a1_1_raw_data_faker_generator:generate_fake_market_data_flow", "run_fake_data", ()),
+    ("news_scraper", "scripts.data_generation.a1_2_news_data_scrapper:crypto_news_scraper", "run_news_scraper", ()),
+    ("data_to_s3", "scripts.data_generation.a1_3_batch_data_to_s3:data_to_s3_flow", "run_upload_to_s3", ("fake_market_data", "news_scraper")),
+    ("s3_to_snowflake", "scripts.data_generation.a1_4_batch_s3_to_snowflake:crypto_news_s3_to_snowflake_flow", "run_s3_to_snowflake", ("data_to_s3",)),
+    ("s3_to_postgres", "scripts.data_generation.a1_5_batch_s3_to_postgres:batch_s3_to_postgres_flow", "run_s3_to_postgres", ("data_to_s3",)),
+    ("dbt_on_snowflake", "scripts.data_generation.a1_6_batch_dbt_build:run_dbt_build_after_staging", "run_dbt_on_snowflake", ("s3_to_snowflake",)),
+]
+
+
+def _load_subflow(target: str):
+    """Import and return the subflow referenced by a "module:attribute" string."""
+    module_name, attr = target.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _safe_run(logger, name: str, fn, **kwargs):
+    """Run a single subflow, returning its result or False on failure."""
+    try:
+        logger.info("▶️ Running subflow: %s", name)
+        result = fn(**kwargs)
+        # Subflows without a return value (e.g. crypto_news_scraper) count as success
+        result = True if result is None else result
+        logger.info("✅ Completed: %s (result=%s)", name, result)
+        return result
+    except Exception as e:
+        logger.error("❌ Subflow %s failed: %s", name, e)
+        return False
+
+
 @flow(name="flow__batch_data_s3_snowflake")
 def batch_data_s3_snowflake(
     run_fake_data: bool = True,
@@ -20,91 +51,54 @@ def batch_data_s3_snowflake(
     run_dbt_on_snowflake: bool = True
 ):
     """
-    Orchestrates 4 specified subflows in sequence:
+    Orchestrates the subflows declared in STEPS in sequence:
 
     1) generate_fake_market_data_flow
     2) crypto_news_scraper
     3) data_to_s3_flow
     4) crypto_news_s3_to_snowflake_flow
+    5) batch_s3_to_postgres_flow
+    6) run_dbt_build_after_staging
 
     Notes:
-    - Each step is executed independently with basic error handling so later steps can still run.
+    - Each step has basic error handling; steps that do not depend on a failed step still run.
+    - A step whose upstream step (see STEPS) was disabled or failed is skipped and left as None.
     - A single canonical data_date (YYYYMMDD_HHMMSS) is computed once and passed to all subflows for filename consistency.
     """
     logger = get_run_logger()
-    logger.info("🚀 Starting batch flow to run 4 subflows")
-
-    results = {
-        "fake_market_data": None,
-        "news_scraper": None,
-        "data_to_s3": None,
-        "s3_to_snowflake": None,
-        "s3_to_postgres": None,
-        "dbt_on_snowflake": None
+    logger.info("🚀 Starting batch flow to run %d subflows", len(STEPS))
+
+    enabled = {
+        "run_fake_data": run_fake_data,
+        "run_news_scraper": run_news_scraper,
+        "run_upload_to_s3": run_upload_to_s3,
+        "run_s3_to_snowflake": run_s3_to_snowflake,
+        "run_s3_to_postgres": run_s3_to_postgres,
+        "run_dbt_on_snowflake": run_dbt_on_snowflake,
     }
+    results = {name: None for name, _, _, _ in STEPS}
 
     # Create a single run data_date suffix to propagate to all subflows
     run_suffix = get_canonical_data_date()
 
-    # 1) Generate fake market data
-    if run_fake_data:
-        try:
-            logger.info("▶️ Running subflow: generate_fake_market_data_flow")
-            results["fake_market_data"] = generate_fake_market_data_flow(data_date=run_suffix)
-            logger.info("✅ Completed: generate_fake_market_data_flow")
-        except Exception as e:
-            logger.error(f"❌ Subflow generate_fake_market_data_flow failed: {e}")
-
-    # 2) Scrape crypto news to local CSV
-    if run_news_scraper:
-        try:
-            logger.info("▶️ Running subflow: crypto_news_scraper")
-            crypto_news_scraper(data_date=run_suffix)
-            results["news_scraper"] = True
-            logger.info("✅ Completed: crypto_news_scraper")
-        except Exception as e:
-            logger.error(f"❌ Subflow crypto_news_scraper failed: {e}")
-            results["news_scraper"] = False
-
-    # 3) Upload CSVs to S3/MinIO
-    if run_upload_to_s3:
-        try:
-            logger.info("▶️ Running subflow: data_to_s3_flow")
-            results["data_to_s3"] = data_to_s3_flow(data_date=run_suffix)
-            logger.info(f"✅ Completed: data_to_s3_flow (result={results['data_to_s3']})")
-        except Exception as e:
-            logger.error(f"❌ Subflow data_to_s3_flow failed: {e}")
-            results["data_to_s3"] = False
-
-    # 4) From S3 to Snowflake staging
-    if run_s3_to_snowflake:
-        try:
-            logger.info("▶️ Running subflow: crypto_news_s3_to_snowflake_flow")
-            results["s3_to_snowflake"] = crypto_news_s3_to_snowflake_flow(data_date=run_suffix)
-            logger.info(f"✅ Completed: crypto_news_s3_to_snowflake_flow (result={results['s3_to_snowflake']})")
-        except Exception as e:
-            logger.error(f"❌ Subflow crypto_news_s3_to_snowflake_flow failed: {e}")
-            results["s3_to_snowflake"] = False
-    # 5) From S3 to Postgres
-    if run_s3_to_postgres:
-        try:
-            logger.info("▶️ Running subflow: batch_s3_to_postgres_flow")
-            results["s3_to_postgres"] = batch_s3_to_postgres_flow(data_date=run_suffix)
-            logger.info(f"✅ Completed: batch_s3_to_postgres_flow (result={results['s3_to_postgres']})")
-        except Exception as e:
-            logger.error(f"❌ Subflow batch_s3_to_postgres_flow failed: {e}")
-            results["s3_to_postgres"] = False
-
-    # 6) DBT Build for Snowflake
-    if run_dbt_on_snowflake:
-        try:
-            logger.info("▶️ Running subflow: run_dbt_build_after_staging")
-            results["dbt_on_snowflake"] = run_dbt_build_after_staging(data_date=run_suffix)
-            logger.info(f"✅ Completed: run_dbt_build_after_staging (result={results['s3_to_postgres']})")
-        except Exception as e:
-            logger.error(f"❌ Subflow run_dbt_build_after_staging failed: {e}")
-            results["dbt_on_snowflake"] = False
-
+    # Share one warm Snowflake session across the subflows of this run only; it is
+    # closed when the block exits and never seen by other flows in the worker
+    with snowflake_pool.warm_session():
+        for name, target, flag, deps in STEPS:
+            if not enabled[flag]:
+                continue
+            # Disabled (None) or failed (False) upstream steps: do not build on stale data
+            blocked = [dep for dep in deps if not results[dep]]
+            if blocked:
+                logger.warning("⏭️ Skipping %s: upstream step(s) %s disabled or failed", name, blocked)
+                continue
+            try:
+                fn = _load_subflow(target)
+            except Exception as e:
+                logger.error("❌ Could not import subflow %s: %s", target, e)
+                results[name] = False
+                continue
+            results[name] = _safe_run(logger, fn.__name__, fn, data_date=run_suffix)
 
     logger.info("🏁 Batch flow finished")
     return results
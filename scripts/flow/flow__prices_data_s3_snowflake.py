@@ -11,7 +11,8 @@ Subflows executed (imported from scripts.data_generation):
 Each subflow:
 - reads seeds/cryptolist.txt
 - fetches latest USD-paired prices/volumes
-- writes data/crypto_{source}_YYYYMMDD_HHMMSS.csv
+- writes data/{source}/YYYYMMDD_HHMMSS/crypto_{source}_YYYYMMDD_HHMMSS.csv
+  (one canonical data_date per orchestration run, shared by all subflows)
 - uploads to MinIO and PUTs to Snowflake stage
 - loads CSV rows into local Postgres raw_cryptoprices_{source}
 
@@ -22,85 +23,114 @@ Usage:
 """
 
 
+import threading
 from pathlib import Path
 from typing import Optional
 
 from prefect import flow, task, get_run_logger
+from prefect.artifacts import create_table_artifact
+from prefect.cache_policies import NONE
 
 # Import subflows
 from scripts.data_generation.a2_1_crypto_binance import crypto_prices_binance_flow
 from scripts.data_generation.a2_2_crypto_coingecko import crypto_prices_coingecko_flow
 from scripts.data_generation.a2_3_crypto_yfinance import crypto_prices_yfinance_flow
 from scripts.data_generation.a2_4_crypto_freecryptoapi import crypto_prices_freecryptoapi_flow
+from scripts.utils.date_utils import get_canonical_data_date
 
+def _bounded(fn, slots: Optional[threading.BoundedSemaphore], data_date: Optional[str]):
+    """Run a subflow while holding one of the run's concurrency slots (if any)."""
+    if slots is None:
+        return fn(data_date=data_date)
+    with slots:
+        return fn(data_date=data_date)
 
-@task(name="Run Binance Subflow")
-def run_binance() -> Optional[Path]:
-    return crypto_prices_binance_flow()
 
+# The semaphore argument cannot be hashed into a cache key, so these tasks opt out of caching
+@task(name="Run Binance Subflow", cache_policy=NONE)
+def run_binance(data_date: Optional[str] = None, slots: Optional[threading.BoundedSemaphore] = None) -> Optional[Path]:
+    return _bounded(crypto_prices_binance_flow, slots, data_date)
 
-@task(name="Run CoinGecko Subflow")
-def run_coingecko() -> Optional[Path]:
-    return crypto_prices_coingecko_flow()
 
+@task(name="Run CoinGecko Subflow", cache_policy=NONE)
+def run_coingecko(data_date: Optional[str] = None, slots: Optional[threading.BoundedSemaphore] = None) -> Optional[Path]:
+    return _bounded(crypto_prices_coingecko_flow, slots, data_date)
 
-@task(name="Run YFinance Subflow")
-def run_yfinance() -> Optional[Path]:
-    return crypto_prices_yfinance_flow()
 
+@task(name="Run YFinance Subflow", cache_policy=NONE)
+def run_yfinance(data_date: Optional[str] = None, slots: Optional[threading.BoundedSemaphore] = None) -> Optional[Path]:
+    return _bounded(crypto_prices_yfinance_flow, slots, data_date)
 
-@task(name="Run FreeCryptoAPI Subflow")
-def run_freecryptoapi() -> Optional[Path]:
-    return crypto_prices_freecryptoapi_flow()
+
+@task(name="Run FreeCryptoAPI Subflow", cache_policy=NONE)
+def run_freecryptoapi(data_date: Optional[str] = None, slots: Optional[threading.BoundedSemaphore] = None) -> Optional[Path]:
+    return _bounded(crypto_prices_freecryptoapi_flow, slots, data_date)
+
+
+SOURCE_TASKS = {
+    "binance": run_binance,
+    "coingecko": run_coingecko,
+    "yfinance": run_yfinance,
+    "freecryptoapi": run_freecryptoapi,
+}
 
 
 @flow(name="flow__prices_data_s3_snowflake")
-def prices_data_s3_snowflake_flow(sources: Optional[list[str]] = None) -> dict[str, Optional[str]]:
-    """Run selected a2_ crypto price subflows sequentially.
+def prices_data_s3_snowflake_flow(
+    sources: Optional[list[str]] = None,
+    max_concurrency: int = 4,
+) -> dict[str, Optional[str]]:
+    """Run selected a2_ crypto price subflows concurrently, at most max_concurrency at a time.
 
     Args:
         sources: list of sources to run from {binance, coingecko, yfinance, freecryptoapi}.
                  If None, runs all four.
+        max_concurrency: maximum number of subflows running at the same time.
 
     Returns:
-        dict mapping source -> CSV local path (as string) or None if failed/skipped
+        dict mapping source -> CSV local path (as string) or None if failed/skipped.
+        Sources whose subflow failed are also published as the "prices-failed-subflows"
+        table artifact, with their error, for inspection after the run.
     """
     logger = get_run_logger()
-    all_sources = ["binance", "coingecko", "yfinance", "freecryptoapi"]
+    all_sources = list(SOURCE_TASKS)
     sources = sources or all_sources
 
     results: dict[str, Optional[str]] = {s: None for s in all_sources}
+    # Dead-letter list of (source, error) for subflows that failed permanently
+    failed: list[tuple[str, str]] = []
+    # Caps how many subflows run at once (DB connections, S3 pools, file descriptors).
+    # One semaphore per run, so concurrent runs in a worker do not share or overwrite it.
+    slots = threading.BoundedSemaphore(max(1, max_concurrency))
 
-    try:
-        logger.info(f"🚀 Starting a2 crypto prices orchestration for: {sources}")
-
-        if "binance" in sources:
-            try:
-                p = run_binance()
-                results["binance"] = str(p) if p else None
-            except Exception as e:
-                logger.error(f"❌ Binance subflow failed: {e}")
+    # Create a single run data_date suffix to propagate to all subflows
+    run_suffix = get_canonical_data_date()
 
-        if "coingecko" in sources:
-            try:
-                p = run_coingecko()
-                results["coingecko"] = str(p) if p else None
-            except Exception as e:
-                logger.error(f"❌ CoinGecko subflow failed: {e}")
+    try:
+        logger.info(f"🚀 Starting a2 crypto prices orchestration for: {sources} (max_concurrency={max_concurrency})")
 
-        if "yfinance" in sources:
-            try:
-                p = run_yfinance()
-                results["yfinance"] = str(p) if p else None
-            except Exception as e:
-                logger.error(f"❌ yfinance subflow failed: {e}")
+        # Prefect's task runner is a thread pool, so .submit() fans the sources out concurrently
+        futures = {
+            source: SOURCE_TASKS[source].submit(data_date=run_suffix, slots=slots)
+            for source in sources
+            if source in SOURCE_TASKS
+        }
 
-        if "freecryptoapi" in sources:
+        for source, future in futures.items():
             try:
-                p = run_freecryptoapi()
-                results["freecryptoapi"] = str(p) if p else None
+                p = future.result()
+                results[source] = str(p) if p else None
             except Exception as e:
-                logger.error(f"⚠️ FreeCryptoAPI subflow failed or skipped: {e}")
+                logger.error(f"❌ {source} subflow failed: {e}")
+                failed.append((source, str(e)))
+
+        if failed:
+            logger.warning(f"⚠️ Failed subflows for inspection: {failed}")
+            create_table_artifact(
+                key="prices-failed-subflows",
+                table=[{"source": source, "error": error} for source, error in failed],
+                description=f"a2 crypto price subflows that failed in run {run_suffix}",
+            )
 
         logger.info("✅ a2 crypto prices orchestration completed")
         return results
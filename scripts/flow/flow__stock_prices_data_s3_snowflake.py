@@ -34,11 +34,16 @@ def run_yfinance() -> Optional[Path]:
     return stock_prices_yfinance_flow()
 
 
+SOURCE_TASKS = {
+    "yfinance": run_yfinance,
+}
+
+
 @flow(name="flow__stock_prices_data_s3_snowflake")
 def stock_prices_data_s3_snowflake_flow(
     sources: Optional[list[str]] = None,
 ) -> dict[str, Optional[str]]:
-    """Run selected a3_ stock price subflows sequentially.
+    """Run selected a3_ stock price subflows concurrently.
 
     Args:
         sources: list of sources to run from {yfinance}. If None, runs all.
@@ -49,19 +54,24 @@ def stock_prices_data_s3_snowflake_flow(
 
     logger = get_run_logger()
 
-    all_sources = ["yfinance"]
+    all_sources = list(SOURCE_TASKS)
     sources = sources or all_sources
 
     results: dict[str, Optional[str]] = {s: None for s in all_sources}
 
     logger.info(f"🚀 Starting a3 stock prices orchestration for: {sources}")
 
-    if "yfinance" in sources:
+    futures = {
+        source: SOURCE_TASKS[source].submit()
+        for source in sources
+        if source in SOURCE_TASKS
+    }
+    for source, future in futures.items():
         try:
-            p = run_yfinance()
-            results["yfinance"] = str(p) if p else None
+            p = future.result()
+            results[source] = str(p) if p else None
         except Exception as e:
-            logger.error(f"❌ yfinance stock subflow failed: {e}")
+            logger.error(f"❌ {source} stock subflow failed: {e}")
 
     logger.info("✅ a3 stock prices orchestration completed")
     return results
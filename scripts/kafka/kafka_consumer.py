@@ -8,18 +8,21 @@ Consumes 4 topics:
 """
 
 import os
-import json
 import time
 import logging
+import weakref
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict
+from typing import Callable, Dict, List, NamedTuple, Sequence
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from kafka import KafkaConsumer
+from kafka.structs import OffsetAndMetadata
 from dotenv import load_dotenv
-import psycopg2
-from psycopg2 import sql
-from psycopg2.extras import execute_values
+from psycopg import sql
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 
 # UTC+7 timezone (e.g., Asia/Bangkok, Indochina Time)
 UTC_PLUS_7 = timezone(timedelta(hours=7))
@@ -48,7 +51,7 @@ KAFKA_TOPIC_CORPORATES = "raw_corporates"
 KAFKA_TOPIC_CUSTOMERS = "raw_customers"
 KAFKA_TOPIC_TRANSACTION_PERSONAL = "raw_transaction_personal"
 KAFKA_TOPIC_TRANSACTION_CORPORATE = "raw_transaction_corporate"
-BATCH_SIZE = int(os.getenv('KAFKA_CONSUMER_BATCH_SIZE', '100'))
+BATCH_SIZE = int(os.getenv('KAFKA_CONSUMER_BATCH_SIZE', '1000'))
 BATCH_TIMEOUT_SECONDS = int(os.getenv('KAFKA_CONSUMER_BATCH_TIMEOUT', '30'))
 
 POSTGRES_HOST = os.getenv("TSDB_HOST")
@@ -64,26 +67,39 @@ TABLE_TRANSACTION_CORPORATES = "raw_transaction_corporate"
 TABLE_CUSTOMERS = "raw_customers"
 TABLE_CORPORATES = "raw_corporates"
 
+# Schema-qualified identifiers, composed once and shared by the DDL and load statements
+TABLE_IDS = {
+    table: sql.Identifier(POSTGRES_SCHEMA, table)
+    for table in (TABLE_TRANSACTION_CUSTOMERS, TABLE_TRANSACTION_CORPORATES, TABLE_CUSTOMERS, TABLE_CORPORATES)
+}
+
+
+# Connection pool shared by table creation and every batch flush, so a flush does not
+# pay a new TCP + auth handshake. Opened in consume_and_load() and closed on shutdown.
+POOL = ConnectionPool(
+    conninfo=make_conninfo(
+        host=POSTGRES_HOST,
+        port=POSTGRES_PORT,
+        dbname=POSTGRES_DB,
+        user=POSTGRES_USER,
+        password=POSTGRES_PASSWORD,
+    ),
+    min_size=2,
+    max_size=8,
+    kwargs={"prepare_threshold": 5},
+    open=False,
+)
+
 
 @contextmanager
 def get_postgres_connection():
-    """Context manager for PostgreSQL connections."""
-    conn = None
+    """Context manager borrowing a PostgreSQL connection from the pool."""
     try:
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
-        yield conn
+        with POOL.connection() as conn:
+            yield conn
     except Exception as e:
         logger.error(f"❌ PostgreSQL connection failed: {e}")
         raise
-    finally:
-        if conn:
-            conn.close()
 
 
 def create_postgres_tables():
@@ -91,19 +107,17 @@ def create_postgres_tables():
     try:
         with get_postgres_connection() as conn:
             cursor = conn.cursor()
+            statements = []
             
             # Create schema if needed
             if POSTGRES_SCHEMA != "public":
-                cursor.execute(
+                statements.append(
                     sql.SQL("CREATE SCHEMA IF NOT EXISTS {}")
                     .format(sql.Identifier(POSTGRES_SCHEMA))
                 )
 
-            # Transaction tables (split by customer type)
-            tx_cust_table = sql.Identifier(POSTGRES_SCHEMA, TABLE_TRANSACTION_CUSTOMERS)
-            tx_corp_table = sql.Identifier(POSTGRES_SCHEMA, TABLE_TRANSACTION_CORPORATES)
-            
-            cursor.execute(sql.SQL("""
+            # Transaction tables (split by customer type) share one definition
+            transaction_ddl = sql.SQL("""
                 CREATE TABLE IF NOT EXISTS {} (
                     transaction_id VARCHAR(100),
                     customer_id VARCHAR(100),
@@ -124,34 +138,12 @@ def create_postgres_tables():
                     source VARCHAR(20) NOT NULL DEFAULT 'KAFKA_DATA',
                     PRIMARY KEY (transaction_id, load_timestamp)
                 )
-            """).format(tx_cust_table))
-            
-            cursor.execute(sql.SQL("""
-                CREATE TABLE IF NOT EXISTS {} (
-                    transaction_id VARCHAR(100),
-                    customer_id VARCHAR(100),
-                    asset_type VARCHAR(20),
-                    asset_symbol VARCHAR(50),
-                    transaction_type VARCHAR(10),
-                    quantity NUMERIC(20,8),
-                    price_per_unit NUMERIC(20,8),
-                    transaction_amount NUMERIC(20,2),
-                    fee_amount NUMERIC(20,2),
-                    transaction_timestamp TIMESTAMP,
-                    data_date DATE,
-                    customer_tier VARCHAR(20),
-                    customer_risk_tolerance VARCHAR(20),
-                    customer_type VARCHAR(20),
-                    data_source VARCHAR(50),
-                    load_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    source VARCHAR(20) NOT NULL DEFAULT 'KAFKA_DATA',
-                    PRIMARY KEY (transaction_id, load_timestamp)
-                )
-            """).format(tx_corp_table))
+            """)
+            statements.append(transaction_ddl.format(TABLE_IDS[TABLE_TRANSACTION_CUSTOMERS]))
+            statements.append(transaction_ddl.format(TABLE_IDS[TABLE_TRANSACTION_CORPORATES]))
             
             # Customers table
-            customers_table = sql.Identifier(POSTGRES_SCHEMA, TABLE_CUSTOMERS)
-            cursor.execute(sql.SQL("""
+            statements.append(sql.SQL("""
                 CREATE TABLE IF NOT EXISTS {} (
                     customer_id VARCHAR(100),
                     first_name VARCHAR(100),
@@ -169,11 +161,10 @@ def create_postgres_tables():
                     source VARCHAR(20) NOT NULL DEFAULT 'KAFKA_DATA',
                     PRIMARY KEY (customer_id, load_timestamp)
                 )
-            """).format(customers_table))
+            """).format(TABLE_IDS[TABLE_CUSTOMERS]))
             
             # Corporates table
-            corporates_table = sql.Identifier(POSTGRES_SCHEMA, TABLE_CORPORATES)
-            cursor.execute(sql.SQL("""
+            statements.append(sql.SQL("""
                 CREATE TABLE IF NOT EXISTS {} (
                     company_id VARCHAR(100),
                     company_name VARCHAR(255),
@@ -188,23 +179,30 @@ def create_postgres_tables():
                     source VARCHAR(20) NOT NULL DEFAULT 'KAFKA_DATA',
                     PRIMARY KEY (company_id, load_timestamp)
                 )
-            """).format(corporates_table))
+            """).format(TABLE_IDS[TABLE_CORPORATES]))
             
+            # Sent as one multi-statement query (allowed without parameters): a single
+            # round trip instead of one per table
+            cursor.execute(sql.SQL(";").join(statements))
             conn.commit()
             return True
             
-    except Exception as e:
-        logger.error(f"❌ Failed to create PostgreSQL tables: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("❌ Failed to create PostgreSQL tables")
         return False
 
 
 def json_deserializer(msg_bytes: bytes) -> Dict:
-    """Simple JSON deserializer for Kafka messages."""
-    if msg_bytes is None:
+    """JSON deserializer for Kafka messages (orjson parses the raw bytes without a decode step).
+
+    orjson reads the fetched buffer directly and allocates only the resulting objects,
+    so messages are not copied into an intermediate buffer first.
+    """
+    # Tombstones / empty payloads: skip the parser (orjson raises on b"", which would
+    # abort the whole poll inside kafka-python's fetcher)
+    if not msg_bytes:
         return {}
-    return json.loads(msg_bytes.decode('utf-8'))
+    return orjson.loads(msg_bytes)
 
 
 def convert_to_utc_plus_7(ts):
@@ -245,202 +243,215 @@ def convert_to_utc_plus_7(ts):
     return datetime.now(UTC_PLUS_7).replace(tzinfo=None)
 
 
-def insert_transactions_batch(rows: List[Dict], table_name: str) -> bool:
-    """Insert a batch of transactions into PostgreSQL."""
-    if not rows:
-        return True
-    
+def convert_str_to_utc_plus_7(value: str, fallback: datetime) -> datetime:
+    """Fast path of convert_to_utc_plus_7 for ISO strings, the only shape json_deserializer
+    produces: no pandas checks, and the caller supplies a per-batch fallback for bad values."""
     try:
-        with get_postgres_connection() as conn:
-            cur = conn.cursor()
-            
-            values = []
-            for r in rows:
-                if not isinstance(r, dict):
-                    continue
-                
-                # Handle load_timestamp - convert to UTC+7
-                load_ts = convert_to_utc_plus_7(r.get("load_timestamp"))
-                
-                # Handle transaction_timestamp - convert to UTC+7
-                txn_ts = r.get("transaction_timestamp")
-                if txn_ts is not None:
-                    txn_ts = convert_to_utc_plus_7(txn_ts)
-                
-                values.append((
-                    r.get("transaction_id"),
-                    r.get("customer_id"),
-                    r.get("asset_type"),
-                    r.get("asset_symbol"),
-                    r.get("transaction_type"),
-                    r.get("quantity"),
-                    r.get("price_per_unit"),
-                    r.get("transaction_amount"),
-                    r.get("fee_amount"),
-                    txn_ts,  # Use converted timestamp
-                    r.get("data_date"),
-                    r.get("customer_tier"),
-                    r.get("customer_risk_tolerance"),
-                    r.get("customer_type"),
-                    r.get("data_source"),
-                    load_ts,  # Use converted timestamp
-                    "KAFKA_DATA",
-                ))
-            
-            if not values:
-                return True
-            
-            table_id = sql.Identifier(POSTGRES_SCHEMA, table_name)
-            insert_sql = sql.SQL("""
-                INSERT INTO {} (
-                    transaction_id, customer_id, asset_type, asset_symbol, transaction_type,
-                    quantity, price_per_unit, transaction_amount, fee_amount,
-                    transaction_timestamp, data_date, customer_tier,
-                    customer_risk_tolerance, customer_type, data_source,
-                    load_timestamp, source
-                ) VALUES %s
-                ON CONFLICT (transaction_id, load_timestamp) DO NOTHING
-            """).format(table_id)
-            
-            execute_values(cur, insert_sql, values)
-            conn.commit()
-            
-            # Log inserted IDs with table name prefix
-            table_prefix = "transaction_personal" if table_name == TABLE_TRANSACTION_CUSTOMERS else "transaction_corporate"
-            for r in rows:
-                if isinstance(r, dict) and r.get('transaction_id'):
-                    logger.info(f"{table_prefix} {r.get('transaction_id')} inserted")
-            
-            return True
-            
-    except Exception as e:
-        logger.error(f"❌ Failed to insert transactions batch: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return False
-
-
-def insert_customers_batch(rows: List[Dict]) -> bool:
-    """Insert a batch of customers into PostgreSQL."""
-    if not rows:
-        return True
-    
-    try:
-        with get_postgres_connection() as conn:
-            cur = conn.cursor()
-            
-            values = []
-            for r in rows:
-                if not isinstance(r, dict):
-                    continue
-                
-                # Handle load_timestamp - convert to UTC+7
-                load_ts = convert_to_utc_plus_7(r.get("load_timestamp"))
-                
-                values.append((
-                    r.get("customer_id"),
-                    r.get("first_name"),
-                    r.get("last_name"),
-                    r.get("email"),
-                    r.get("gender"),
-                    r.get("age_group"),
-                    r.get("country"),
-                    r.get("registration_date"),
-                    r.get("customer_tier"),
-                    r.get("risk_tolerance"),
-                    r.get("customer_type"),
-                    r.get("company_id"),
-                    load_ts,
-                    "KAFKA_DATA",
-                ))
-            
-            if not values:
-                return True
-            
-            table_id = sql.Identifier(POSTGRES_SCHEMA, TABLE_CUSTOMERS)
-            insert_sql = sql.SQL("""
-                INSERT INTO {} (
-                    customer_id, first_name, last_name, email, gender, age_group, country,
-                    registration_date, customer_tier, risk_tolerance, customer_type, company_id,
-                    load_timestamp, source
-                ) VALUES %s
-                ON CONFLICT (customer_id, load_timestamp) DO NOTHING
-            """).format(table_id)
-            
-            execute_values(cur, insert_sql, values)
-            conn.commit()
-            
-            # Log inserted IDs
-            for r in rows:
-                if isinstance(r, dict) and r.get('customer_id'):
-                    logger.info(f"customer {r.get('customer_id')} inserted")
-            
-            return True
-            
-    except Exception as e:
-        logger.error(f"❌ Failed to insert customers batch: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return False
-
-
-def insert_corporates_batch(rows: List[Dict]) -> bool:
-    """Insert a batch of corporates into PostgreSQL."""
+        ts = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return fallback
+    if ts.tzinfo is None:
+        # Assume UTC if no timezone info
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(UTC_PLUS_7).replace(tzinfo=None)
+
+
+def to_utc_plus_7(value, fallback: datetime) -> datetime:
+    """Normalize a message timestamp, using the string fast path when possible."""
+    if value is None:
+        return fallback
+    if isinstance(value, str):
+        return convert_str_to_utc_plus_7(value, fallback)
+    return convert_to_utc_plus_7(value)
+
+
+TRANSACTION_COLUMNS = (
+    "transaction_id", "customer_id", "asset_type", "asset_symbol", "transaction_type",
+    "quantity", "price_per_unit", "transaction_amount", "fee_amount",
+    "transaction_timestamp", "data_date", "customer_tier",
+    "customer_risk_tolerance", "customer_type", "data_source",
+    "load_timestamp", "source",
+)
+CUSTOMER_COLUMNS = (
+    "customer_id", "first_name", "last_name", "email", "gender", "age_group", "country",
+    "registration_date", "customer_tier", "risk_tolerance", "customer_type", "company_id",
+    "load_timestamp", "source",
+)
+CORPORATE_COLUMNS = (
+    "company_id", "company_name", "company_type", "company_email", "country", "year_founded",
+    "tax_number", "office_primary_location", "registration_date", "load_timestamp", "source",
+)
+
+# Message keys copied as-is into each row: every column except the trailing
+# load_timestamp (normalized to UTC+7) and source (constant)
+TRANSACTION_FIELDS = TRANSACTION_COLUMNS[:-2]
+CUSTOMER_FIELDS = CUSTOMER_COLUMNS[:-2]
+CORPORATE_FIELDS = CORPORATE_COLUMNS[:-2]
+TRANSACTION_TIMESTAMP_INDEX = TRANSACTION_FIELDS.index("transaction_timestamp")
+
+
+def compose_copy_sql(table_name: str, columns, conflict_columns):
+    """Compose the (create temp table, copy, insert) statements used by copy_then_insert."""
+    table_id = TABLE_IDS[table_name]
+    temp_id = sql.Identifier(f"tmp_{table_name}")
+    column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+
+    create_temp = sql.SQL(
+        "CREATE TEMP TABLE IF NOT EXISTS {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    ).format(temp_id, table_id)
+    copy = sql.SQL("COPY {} ({}) FROM STDIN").format(temp_id, column_list)
+    insert = sql.SQL("""
+        INSERT INTO {} ({}) SELECT {} FROM {}
+        ON CONFLICT ({}) DO NOTHING
+    """).format(
+        table_id,
+        column_list,
+        column_list,
+        temp_id,
+        sql.SQL(", ").join(map(sql.Identifier, conflict_columns)),
+    )
+    return create_temp, copy, insert
+
+
+# Target tables are constants, so their statements are composed once at import
+# rather than on every flush
+COPY_SQL = {
+    TABLE_TRANSACTION_CUSTOMERS: compose_copy_sql(
+        TABLE_TRANSACTION_CUSTOMERS, TRANSACTION_COLUMNS, ("transaction_id", "load_timestamp")
+    ),
+    TABLE_TRANSACTION_CORPORATES: compose_copy_sql(
+        TABLE_TRANSACTION_CORPORATES, TRANSACTION_COLUMNS, ("transaction_id", "load_timestamp")
+    ),
+    TABLE_CUSTOMERS: compose_copy_sql(TABLE_CUSTOMERS, CUSTOMER_COLUMNS, ("customer_id", "load_timestamp")),
+    TABLE_CORPORATES: compose_copy_sql(TABLE_CORPORATES, CORPORATE_COLUMNS, ("company_id", "load_timestamp")),
+}
+
+
+# Pooled connection -> names of the tables whose tmp_ table exists in that session
+_temp_tables_created = weakref.WeakKeyDictionary()
+
+
+def copy_then_insert(cur, table_name: str, values: List[tuple]):
+    """Bulk load values through COPY into a session TEMP table, then move them into
+    the target table with a single INSERT ... ON CONFLICT DO NOTHING (COPY itself
+    cannot skip duplicates)."""
+    create_temp, copy_sql, insert_sql = COPY_SQL[table_name]
+
+    # Temp tables live as long as the pooled session, so the DDL is only sent the first
+    # time a connection loads a table: a flush is then just COPY + INSERT.
+    # Committed straight away so a later rollback of the batch cannot drop it again.
+    conn = cur.connection
+    created = _temp_tables_created.setdefault(conn, set())
+    if table_name not in created:
+        cur.execute(create_temp)
+        conn.commit()
+        created.add(table_name)
+
+    with cur.copy(copy_sql) as copy:
+        for row in values:
+            copy.write_row(row)
+
+    cur.execute(insert_sql)
+
+
+# Below this many rows the per-value fast path beats building a pandas index
+VECTORIZE_MIN_ROWS = 64
+
+
+def to_utc_plus_7_column(values: list, fallback: datetime, missing) -> list:
+    """Normalize a whole batch column to naive UTC+7. None maps to `missing`,
+    unparseable values to `fallback`. Uses one vectorized pandas parse when
+    pandas is installed and the batch is large enough."""
+    if HAS_PANDAS and len(values) >= VECTORIZE_MIN_ROWS:
+        try:
+            parsed = pd.to_datetime(values, utc=True, errors="coerce", format="ISO8601")
+            converted = parsed.tz_convert(UTC_PLUS_7).tz_localize(None).to_pydatetime()
+            return [
+                missing if raw is None else (fallback if ts is pd.NaT else ts)
+                for raw, ts in zip(values, converted)
+            ]
+        except (TypeError, ValueError):
+            # Mixed/non-string values: fall through to the per-value path
+            pass
+    return [missing if v is None else to_utc_plus_7(v, fallback) for v in values]
+
+
+def transaction_rows(rows: List[Dict], now_utc7: datetime) -> List[list]:
+    """Shape transaction messages into TRANSACTION_COLUMNS rows."""
+    txn_ts = to_utc_plus_7_column([r.get("transaction_timestamp") for r in rows], now_utc7, None)
+    load_ts = to_utc_plus_7_column([r.get("load_timestamp") for r in rows], now_utc7, now_utc7)
+
+    values = []
+    for r, txn, load in zip(rows, txn_ts, load_ts):
+        # One C-level pass over the schema keys instead of a .get() call per column
+        row = list(map(r.get, TRANSACTION_FIELDS))
+        row[TRANSACTION_TIMESTAMP_INDEX] = txn
+        row.append(load)
+        row.append("KAFKA_DATA")
+        values.append(row)
+    return values
+
+
+def customer_rows(rows: List[Dict], now_utc7: datetime) -> List[tuple]:
+    """Shape customer messages into CUSTOMER_COLUMNS rows."""
+    load_ts = to_utc_plus_7_column([r.get("load_timestamp") for r in rows], now_utc7, now_utc7)
+    return [(*map(r.get, CUSTOMER_FIELDS), load, "KAFKA_DATA") for r, load in zip(rows, load_ts)]
+
+
+def corporate_rows(rows: List[Dict], now_utc7: datetime) -> List[tuple]:
+    """Shape corporate messages into CORPORATE_COLUMNS rows."""
+    load_ts = to_utc_plus_7_column([r.get("load_timestamp") for r in rows], now_utc7, now_utc7)
+    return [(*map(r.get, CORPORATE_FIELDS), load, "KAFKA_DATA") for r, load in zip(rows, load_ts)]
+
+
+class TableConfig(NamedTuple):
+    """Everything insert_batch needs to load one topic into its table."""
+    table_name: str
+    label: str
+    id_key: str
+    rows_fn: Callable[[List[Dict], datetime], List[Sequence]]
+
+
+TOPIC_TABLES = {
+    KAFKA_TOPIC_TRANSACTION_PERSONAL: TableConfig(
+        TABLE_TRANSACTION_CUSTOMERS, "transaction_personal", "transaction_id", transaction_rows
+    ),
+    KAFKA_TOPIC_TRANSACTION_CORPORATE: TableConfig(
+        TABLE_TRANSACTION_CORPORATES, "transaction_corporate", "transaction_id", transaction_rows
+    ),
+    KAFKA_TOPIC_CUSTOMERS: TableConfig(TABLE_CUSTOMERS, "customer", "customer_id", customer_rows),
+    KAFKA_TOPIC_CORPORATES: TableConfig(TABLE_CORPORATES, "corporate", "company_id", corporate_rows),
+}
+
+
+def insert_batch(rows: List[Dict], cfg: TableConfig) -> bool:
+    """Insert a batch of messages into the table described by cfg."""
     if not rows:
         return True
     
     try:
         with get_postgres_connection() as conn:
             cur = conn.cursor()
+            # Resolved once per flush and used for every missing/invalid timestamp
+            now_utc7 = datetime.now(UTC_PLUS_7).replace(tzinfo=None)
             
-            values = []
-            for r in rows:
-                if not isinstance(r, dict):
-                    continue
-                
-                # Handle load_timestamp - convert to UTC+7
-                load_ts = convert_to_utc_plus_7(r.get("load_timestamp"))
-                
-                values.append((
-                    r.get("company_id"),
-                    r.get("company_name"),
-                    r.get("company_type"),
-                    r.get("company_email"),
-                    r.get("country"),
-                    r.get("year_founded"),
-                    r.get("tax_number"),
-                    r.get("office_primary_location"),
-                    r.get("registration_date"),
-                    load_ts,
-                    "KAFKA_DATA",
-                ))
-            
-            if not values:
-                return True
-            
-            table_id = sql.Identifier(POSTGRES_SCHEMA, TABLE_CORPORATES)
-            insert_sql = sql.SQL("""
-                INSERT INTO {} (
-                    company_id, company_name, company_type, company_email, country, year_founded,
-                    tax_number, office_primary_location, registration_date, load_timestamp, source
-                ) VALUES %s
-                ON CONFLICT (company_id, load_timestamp) DO NOTHING
-            """).format(table_id)
+            # Rows are dicts: consume_and_load() only batches dict message values
+            values = cfg.rows_fn(rows, now_utc7)
             
-            execute_values(cur, insert_sql, values)
+            copy_then_insert(cur, cfg.table_name, values)
             conn.commit()
             
-            # Log inserted IDs
-            for r in rows:
-                if isinstance(r, dict) and r.get('company_id'):
-                    logger.info(f"corporate {r.get('company_id')} inserted")
+            # One summary line per batch; per-ID detail only when debugging
+            logger.info("%s: inserted %d rows", cfg.label, len(values))
+            if logger.isEnabledFor(logging.DEBUG):
+                for r in rows:
+                    if r.get(cfg.id_key):
+                        logger.debug("%s %s inserted", cfg.label, r.get(cfg.id_key))
             
             return True
             
-    except Exception as e:
-        logger.error(f"❌ Failed to insert corporates batch: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("❌ Failed to insert %s batch", cfg.label)
         return False
 
 
@@ -449,124 +460,140 @@ def consume_and_load():
     logger.info("Starting Kafka consumer...")
     logger.info(f"Connecting to Kafka: {KAFKA_BOOTSTRAP_SERVERS}")
     logger.info(f"Connecting to PostgreSQL: {POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}")
+    POOL.open()
     
     if not create_postgres_tables():
         logger.error("Failed to create PostgreSQL tables. Exiting.")
+        POOL.close()
         return
     
     logger.info("PostgreSQL tables created/verified successfully")
     logger.info("Starting to consume messages from Kafka topics...")
     logger.info(f"Topics: {KAFKA_TOPIC_TRANSACTION_PERSONAL}, {KAFKA_TOPIC_TRANSACTION_CORPORATE}, {KAFKA_TOPIC_CUSTOMERS}, {KAFKA_TOPIC_CORPORATES}")
 
-    # Create consumers with JSON deserializer - simple and clean
-    consumers = {
-        "txn_cust": KafkaConsumer(
-            KAFKA_TOPIC_TRANSACTION_PERSONAL,
-            bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-            group_id="txn-customer-consumer",
-            enable_auto_commit=True,
-            auto_offset_reset="latest",
-            value_deserializer=json_deserializer,
-        ),
-        "txn_corp": KafkaConsumer(
-            KAFKA_TOPIC_TRANSACTION_CORPORATE,
-            bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-            group_id="txn-corporate-consumer",
-            enable_auto_commit=True,
-            auto_offset_reset="latest",
-            value_deserializer=json_deserializer,
-        ),
-        "customers": KafkaConsumer(
-            KAFKA_TOPIC_CUSTOMERS,
-            bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-            group_id="customers-consumer-latest",
-            enable_auto_commit=True,
-            auto_offset_reset="latest",
-            value_deserializer=json_deserializer,
-        ),
-        "corporates": KafkaConsumer(
-            KAFKA_TOPIC_CORPORATES,
-            bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-            group_id="corporates-consumer-latest",
-            enable_auto_commit=True,
-            auto_offset_reset="latest",
-            value_deserializer=json_deserializer,
-        ),
-    }
+    # One consumer subscribed to all four topics: a single fetch round trip per poll,
+    # records are routed to their batch by topic
+    consumer = KafkaConsumer(
+        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
+        group_id="pipeline-consumer",
+        # Offsets are committed manually, only after the batch is committed to Postgres
+        enable_auto_commit=False,
+        auto_offset_reset="latest",
+        value_deserializer=json_deserializer,
+        # Let the broker accumulate up to 1MB (or 500ms) per fetch so a poll returns
+        # close to a full BATCH_SIZE; the wait cap keeps customers/corporates timely
+        fetch_min_bytes=1_048_576,
+        fetch_max_wait_ms=500,
+        max_partition_fetch_bytes=10_485_760,
+        max_poll_records=1000,
+        # Record-batch CRC32C checks stay on (check_crcs defaults to True); the image
+        # installs the crc32c extension, which kafka-python uses instead of its pure-Python CRC
+    )
+    consumer.subscribe([
+        KAFKA_TOPIC_TRANSACTION_PERSONAL,
+        KAFKA_TOPIC_TRANSACTION_CORPORATE,
+        KAFKA_TOPIC_CUSTOMERS,
+        KAFKA_TOPIC_CORPORATES,
+    ])
 
     txn_cust_batch, txn_corp_batch = [], []
     customer_batch, corporate_batch = [], []
+    batches = {
+        KAFKA_TOPIC_TRANSACTION_PERSONAL: txn_cust_batch,
+        KAFKA_TOPIC_TRANSACTION_CORPORATE: txn_corp_batch,
+        KAFKA_TOPIC_CUSTOMERS: customer_batch,
+        KAFKA_TOPIC_CORPORATES: corporate_batch,
+    }
+    # Per topic: {TopicPartition: (first_offset, last_offset)} of records in the pending batch
+    pending_offsets = {topic: {} for topic in batches}
     last_flush = time.time()
 
+    # Flushes run on a small worker pool so the next poll() overlaps the Postgres round
+    # trips. Offsets are still committed/rewound on this thread (KafkaConsumer is not
+    # thread-safe), once the flush future has finished.
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pg-flush")
+    in_flight = {}  # topic -> (future, {TopicPartition: (first_offset, last_offset)})
+
+    def settle(topic: str, wait: bool = False) -> bool:
+        """Commit or rewind the topic's in-flight flush; False if it is still running."""
+        entry = in_flight.get(topic)
+        if entry is None:
+            return True
+        future, offsets = entry
+        if not wait and not future.done():
+            return False
+        del in_flight[topic]
+        if future.result():
+            consumer.commit({tp: OffsetAndMetadata(last + 1, "", -1) for tp, (_, last) in offsets.items()})
+        else:
+            # Rewind every partition touched by the failed batch or the pending one to its
+            # earliest uncommitted record; a partition only in the pending batch would
+            # otherwise be dropped below without ever being redelivered
+            rewind = {tp: first for tp, (first, _) in pending_offsets[topic].items()}
+            for tp, (first, _) in offsets.items():
+                rewind[tp] = min(first, rewind.get(tp, first))
+            for tp, first in rewind.items():
+                consumer.seek(tp, first)
+            batches[topic].clear()
+            pending_offsets[topic].clear()
+        return True
+
+    def flush(topic: str) -> None:
+        """Hand the topic's batch to the flush pool; one flush per topic at a time keeps offsets ordered."""
+        if not settle(topic):
+            return
+        offsets = pending_offsets[topic]
+        if not offsets:
+            return
+        batch = batches[topic]
+        future = executor.submit(insert_batch, list(batch), TOPIC_TABLES[topic])
+        in_flight[topic] = (future, dict(offsets))
+        batch.clear()
+        offsets.clear()
+
     try:
         while True:
-            # Poll all topics
-            txn_cust_records = consumers["txn_cust"].poll(500)
-            if txn_cust_records:
-                for records in txn_cust_records.values():
-                    for r in records:
-                        # r.value is already a dict thanks to value_deserializer
-                        if r.value and isinstance(r.value, dict):
-                            txn_cust_batch.append(r.value)
-
-            txn_corp_records = consumers["txn_corp"].poll(500)
-            if txn_corp_records:
-                for records in txn_corp_records.values():
-                    for r in records:
-                        # r.value is already a dict thanks to value_deserializer
-                        if r.value and isinstance(r.value, dict):
-                            txn_corp_batch.append(r.value)
-
-            customer_records = consumers["customers"].poll(500)
-            if customer_records:
-                for records in customer_records.values():
-                    for r in records:
-                        # r.value is already a dict thanks to value_deserializer
-                        if r.value and isinstance(r.value, dict):
-                            customer_batch.append(r.value)
-                
-                # Flush customer batch immediately after receiving messages
-                if customer_batch:
-                    insert_customers_batch(customer_batch)
-                    customer_batch.clear()
-
-            corporate_records = consumers["corporates"].poll(500)
-            if corporate_records:
-                for records in corporate_records.values():
-                    for r in records:
-                        # r.value is already a dict thanks to value_deserializer
-                        if r.value and isinstance(r.value, dict):
-                            corporate_batch.append(r.value)
-                
-                # Flush corporate batch immediately after receiving messages
-                if corporate_batch:
-                    insert_corporates_batch(corporate_batch)
-                    corporate_batch.clear()
-
-            # Flush condition for transactions (customer/corporate batches are flushed immediately above)
+            # fetch_max_wait_ms bounds how long the broker holds the request, so no extra sleep is needed
+            records = consumer.poll(timeout_ms=500)
+            for tp, msgs in records.items():
+                if not msgs:
+                    continue
+                batch = batches[tp.topic]
+                for r in msgs:
+                    # r.value is already a dict thanks to value_deserializer
+                    if r.value and isinstance(r.value, dict):
+                        batch.append(r.value)
+                first, _ = pending_offsets[tp.topic].get(tp, (msgs[0].offset, None))
+                pending_offsets[tp.topic][tp] = (first, msgs[-1].offset)
+
+            # Commit offsets of flushes that completed while we were polling
+            for topic in list(in_flight):
+                settle(topic)
+
+            # Flush customer/corporate batches immediately after receiving messages
+            flush(KAFKA_TOPIC_CUSTOMERS)
+            flush(KAFKA_TOPIC_CORPORATES)
+
+            # Flush condition for transactions
             now = time.time()
             if (
                 len(txn_cust_batch) >= BATCH_SIZE
                 or len(txn_corp_batch) >= BATCH_SIZE
                 or (now - last_flush) >= BATCH_TIMEOUT_SECONDS
             ):
-                if txn_cust_batch:
-                    insert_transactions_batch(txn_cust_batch, TABLE_TRANSACTION_CUSTOMERS)
-                    txn_cust_batch.clear()
-
-                if txn_corp_batch:
-                    insert_transactions_batch(txn_corp_batch, TABLE_TRANSACTION_CORPORATES)
-                    txn_corp_batch.clear()
-
+                flush(KAFKA_TOPIC_TRANSACTION_PERSONAL)
+                flush(KAFKA_TOPIC_TRANSACTION_CORPORATE)
                 last_flush = now
 
-            time.sleep(0.1)
-
     except KeyboardInterrupt:
         pass
     finally:
-        for c in consumers.values():
-            c.close()
+        # Let running flushes finish so their offsets are committed before shutdown
+        for topic in list(in_flight):
+            settle(topic, wait=True)
+        executor.shutdown()
+        consumer.close()
+        POOL.close()
 
 
 if __name__ == "__main__":
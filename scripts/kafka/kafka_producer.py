@@ -4,19 +4,22 @@ This replaces the Prefect flow for continuous data generation.
 """
 
 import os
-import json
 import time
 import random
-import uuid
-from datetime import datetime, timedelta, timezone, date
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Dict
 import logging
+from functools import lru_cache
 
+import numpy as np
+import orjson
 from kafka import KafkaProducer
-from faker import Faker
+from scripts.utils import faker_pool
+from scripts.utils.faker_pool import (
+    cumulative_weights, fake_values, personal_email, random_hex_ids, random_uuids,
+)
 from dotenv import load_dotenv
-import pandas as pd
 
 # UTC+7 timezone (e.g., Asia/Bangkok, Indochina Time)
 UTC_PLUS_7 = timezone(timedelta(hours=7))
@@ -28,26 +31,29 @@ UTC_PLUS_7 = timezone(timedelta(hours=7))
 # Setup
 # ------------------------------------------------------------------
 load_dotenv()
-fake = Faker()
+# One PCG64 generator for the process; set PIPE_SEED for reproducible runs (0 = OS entropy).
+# IDs are drawn from it too, and the Faker pools and the stdlib draws share the seed.
+PIPE_SEED = int(os.getenv('PIPE_SEED', '0'))
+_rng = np.random.default_rng(PIPE_SEED or None)
+_random = random.Random(PIPE_SEED or None)
+if PIPE_SEED:
+    faker_pool.seed(PIPE_SEED)
 
-def json_serializer(obj):
-    if isinstance(obj, (datetime, date)):
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def orjson_default(obj):
+    """Fallback for values orjson does not encode natively (e.g. datetime subclasses)."""
+    if hasattr(obj, 'isoformat'):  # Handle other datetime-like objects
         return obj.isoformat()
     raise TypeError(f"Type {type(obj)} not serializable")
 
-def json_serialize_value(v):
-    """Serialize a value to JSON, handling datetime objects."""
-    if isinstance(v, dict):
-        return {k: json_serialize_value(val) for k, val in v.items()}
-    elif isinstance(v, list):
-        return [json_serialize_value(item) for item in v]
-    elif isinstance(v, (datetime, date)):
-        return v.isoformat()
-    elif isinstance(v, pd.Timestamp):
-        return v.isoformat()
-    elif hasattr(v, 'isoformat'):  # Handle other datetime-like objects
-        return v.isoformat()
-    return v
+
+def json_serialize_value(v) -> bytes:
+    """Serialize a message value to JSON bytes in one orjson pass: datetime/date values
+    are encoded natively, no recursive pre-walk.
+    Naive datetimes are tagged as UTC, which is how the consumer reads them."""
+    return orjson.dumps(v, default=orjson_default, option=ORJSON_OPTIONS)
 
 
 logging.basicConfig(level=logging.WARNING, format="%(message)s")
@@ -106,6 +112,24 @@ TRANSACTION_TYPES = ['BUY', 'SELL']
 CUSTOMER_GENDERS = ['M', 'F', 'Other']
 CUSTOMER_AGE_GROUPS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
 
+# Sampling tables for the batch generators (probabilities sum to 1)
+AGE_GROUP_LABELS = np.array(CUSTOMER_AGE_GROUPS)
+AGE_GROUP_BINS = [26, 36, 46, 56, 66]
+CUSTOMER_GENDER_WEIGHTS = [0.49, 0.49, 0.02]
+COUNTRIES = ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH']
+COUNTRY_WEIGHTS = [0.60, 0.10, 0.08, 0.05, 0.04, 0.04, 0.03, 0.02, 0.02, 0.02]
+COMPANY_TYPE_WEIGHTS = [0.5, 0.2, 0.3]
+CUSTOMER_TIERS = ['Bronze', 'Silver', 'Gold', 'Platinum']
+CUSTOMER_TIER_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+RISK_TOLERANCES = ['Conservative', 'Moderate', 'Aggressive']
+RISK_TOLERANCE_WEIGHTS = [0.3, 0.5, 0.2]
+
+# (lot choices x100 shares, cumulative weights) per customer segment
+STOCK_LOTS_CORPORATE = ([1, 2, 5, 10, 20, 50], cumulative_weights([10, 15, 25, 25, 15, 10]))
+STOCK_LOTS_GOLD_PLATINUM = ([1, 2, 3, 5, 10], cumulative_weights([25, 25, 20, 20, 10]))
+STOCK_LOTS_SILVER = ([1, 2, 3, 5], cumulative_weights([40, 30, 20, 10]))
+STOCK_LOTS_BRONZE = ([1, 2, 3], cumulative_weights([60, 30, 10]))
+
 # Price ranges for different asset types
 STOCK_PRICE_RANGES = {
     'NVDA': (400, 900), 'AAPL': (150, 250), 'MSFT': (300, 450), 'AMZN': (100, 200),
@@ -152,318 +176,337 @@ def load_asset_lists() -> tuple[List[str], List[str]]:
 # 6. Generator Functions
 # ==============================================================
 
-def generate_corporate_demographics(num_corporates: int = 100) -> pd.DataFrame:
-    """Generate corporate/company demographic data using Faker."""
-    corporates = []
+REGISTRATION_DAYS_BACK = 3653  # ~10 years
+
+
+@lru_cache(maxsize=1)
+def registration_date_strings(today: date) -> tuple:
+    """'%Y-%m-%d' strings for today and the REGISTRATION_DAYS_BACK days before it.
+    Built once per calendar day, so registration dates are a tuple lookup, not a strftime."""
+    return tuple((today - timedelta(days=days)).strftime('%Y-%m-%d') for days in range(REGISTRATION_DAYS_BACK))
+
+
+def random_registration_dates(n: int) -> List[str]:
+    """n registration dates within the last 10 years."""
+    date_strings = registration_date_strings(date.today())
+    return [date_strings[days] for days in _rng.integers(0, REGISTRATION_DAYS_BACK, size=n).tolist()]
+
+
+def generate_corporate_demographics(num_corporates: int = 100, load_ts: datetime = None) -> List[Dict]:
+    """Generate a batch of corporate/company records, drawing every column for the whole batch at once."""
+    # UTC+7 timezone-aware load timestamp, shared by the whole batch
+    load_timestamp = load_ts or datetime.now(UTC_PLUS_7)
     
-    for i in range(num_corporates):
-        # Generate company name
-        company_name = fake.company()
-        
-        # Generate company type (LLC, PUBLIC, PRIVATE)
-        company_type = random.choices(COMPANY_TYPES, weights=[50, 20, 30])[0]
-        
-        # Generate country with realistic distribution
-        country = random.choices(
-            ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH'],
-            weights=[60, 10, 8, 5, 4, 4, 3, 2, 2, 2]
-        )[0]
-        
-        # Generate year founded (between 1950 and 2020)
-        year_founded = fake.random_int(min=1950, max=2020)
-        
-        # Generate tax number (EIN/TIN format varies by country)
-        if country == 'US':
-            # US EIN format: XX-XXXXXXX
-            tax_number = f"{fake.random_int(10, 99)}-{fake.random_int(1000000, 9999999)}"
-        elif country in ['CA', 'UK', 'AU']:
-            # Format: XXXXXXXXX
-            tax_number = str(fake.random_int(100000000, 999999999))
-        else:
-            # European format: XX.XXX.XXX/XXXX-XX
-            tax_number = f"{fake.random_int(10, 99)}.{fake.random_int(100, 999)}.{fake.random_int(100, 999)}/{fake.random_int(1000, 9999)}-{fake.random_int(10, 99)}"
-        
-        # Generate primary office location
-        office_location = fake.address().replace('\n', ', ')
-        
-        # Generate company email
-        company_email = f"info@{fake.domain_name()}"
-        
-        # Generate company ID
-        company_id = str(uuid.uuid4().hex[:12].upper())
-        
-        corporate = {
+    company_types = _rng.choice(COMPANY_TYPES, p=COMPANY_TYPE_WEIGHTS, size=num_corporates).tolist()
+    countries = _rng.choice(COUNTRIES, p=COUNTRY_WEIGHTS, size=num_corporates)
+    # Year founded (between 1950 and 2020)
+    years_founded = _rng.integers(1950, 2021, size=num_corporates).tolist()
+    
+    # Tax number digit groups for every row; the country picks the format below
+    tax_a = _rng.integers(10, 100, size=num_corporates)
+    tax_b = _rng.integers(1000000, 10000000, size=num_corporates)
+    tax_c = _rng.integers(100000000, 1000000000, size=num_corporates)
+    tax_d = _rng.integers(100, 1000, size=(num_corporates, 2))
+    tax_e = _rng.integers(1000, 10000, size=num_corporates)
+    tax_f = _rng.integers(10, 100, size=num_corporates)
+    is_us = countries == 'US'
+    is_nine_digit = np.isin(countries, ['CA', 'UK', 'AU'])
+    tax_numbers = [
+        # US EIN format: XX-XXXXXXX
+        f"{a}-{b}" if us
+        # Format: XXXXXXXXX
+        else str(c) if nine_digit
+        # European format: XX.XXX.XXX/XXXX-XX
+        else f"{a}.{d1}.{d2}/{e}-{f}"
+        for us, nine_digit, a, b, c, (d1, d2), e, f in zip(
+            is_us.tolist(), is_nine_digit.tolist(), tax_a.tolist(), tax_b.tolist(),
+            tax_c.tolist(), tax_d.tolist(), tax_e.tolist(), tax_f.tolist(),
+        )
+    ]
+    
+    return [
+        {
             'company_id': company_id,
             'company_name': company_name,
             'company_type': company_type,
-            'company_email': company_email,
+            'company_email': f"info@{domain}",
             'country': country,
             'year_founded': year_founded,
             'tax_number': tax_number,
             'office_primary_location': office_location,
-            'registration_date': fake.date_between(start_date='-10y', end_date='today').strftime('%Y-%m-%d')
+            'registration_date': registration_date,
+            'load_timestamp': load_timestamp,
         }
-        corporates.append(corporate)
-    
-    df = pd.DataFrame(corporates)
-    # Store as UTC+7 timezone-aware datetime using pandas Timestamp
-    df['load_timestamp'] = pd.Timestamp.now(tz='Asia/Bangkok')  # UTC+7
-    return df
-
-
-def generate_customer(corporates_df: pd.DataFrame = None) -> Dict:
-    """Generate a single customer record."""
-    age = fake.random_int(min=18, max=80)
-    if age <= 25:
-        age_group = '18-25'
-    elif age <= 35:
-        age_group = '26-35'
-    elif age <= 45:
-        age_group = '36-45'
-    elif age <= 55:
-        age_group = '46-55'
-    elif age <= 65:
-        age_group = '56-65'
-    else:
-        age_group = '65+'
-    
-    gender = random.choices(['M', 'F', 'Other'], weights=[49, 49, 2])[0]
-    country = random.choices(
-        ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH'],
-        weights=[60, 10, 8, 5, 4, 4, 3, 2, 2, 2]
-    )[0]
+        for company_id, company_name, company_type, domain, country, year_founded, tax_number, office_location, registration_date
+        in zip(
+            random_hex_ids(num_corporates, 12, _rng), fake_values("company", num_corporates), company_types,
+            fake_values("domain_name", num_corporates), countries.tolist(), years_founded, tax_numbers,
+            fake_values("address", num_corporates), random_registration_dates(num_corporates),
+        )
+    ]
+
+
+def generate_customers_batch(num_customers: int, corporates: List[Dict] = None, load_ts: datetime = None) -> List[Dict]:
+    """Generate a batch of customer records, drawing every column for the whole batch at once."""
+    customer_types = _rng.choice(['PERSONAL', 'CORPORATE'], p=[0.8, 0.2], size=num_customers).tolist()
+    # Age group via branchless binning of ages 18-80 into CUSTOMER_AGE_GROUPS
+    ages = _rng.integers(18, 81, size=num_customers)
+    age_groups = AGE_GROUP_LABELS[np.digitize(ages, AGE_GROUP_BINS)].tolist()
+    genders = _rng.choice(CUSTOMER_GENDERS, p=CUSTOMER_GENDER_WEIGHTS, size=num_customers).tolist()
+    countries = _rng.choice(COUNTRIES, p=COUNTRY_WEIGHTS, size=num_customers).tolist()
+    tiers = _rng.choice(CUSTOMER_TIERS, p=CUSTOMER_TIER_WEIGHTS, size=num_customers).tolist()
+    risk_tolerances = _rng.choice(RISK_TOLERANCES, p=RISK_TOLERANCE_WEIGHTS, size=num_customers).tolist()
+    registration_dates = random_registration_dates(num_customers)
+    load_timestamp = load_ts or datetime.now(UTC_PLUS_7)
+
+    customers = [
+        {
+            'customer_id': customer_id,
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': personal_email(first_name, last_name, customer_id),
+            'gender': gender,
+            'age_group': age_group,
+            'country': country,
+            'registration_date': registration_date,
+            'customer_tier': tier,
+            'risk_tolerance': risk_tolerance,
+            'customer_type': customer_type,
+            'company_id': None,
+            'load_timestamp': load_timestamp,
+        }
+        for customer_id, first_name, last_name, gender, age_group, country, registration_date, tier, risk_tolerance, customer_type
+        in zip(
+            random_hex_ids(num_customers, 10, _rng), fake_values("first_name", num_customers), fake_values("last_name", num_customers),
+            genders, age_groups, countries, registration_dates,
+            tiers, risk_tolerances, customer_types,
+        )
+    ]
 
-    customer_type = random.choices(['PERSONAL', 'CORPORATE'], weights=[80, 20])[0]
-        
     # Link corporate customers to corporate records
-    company_id = None
-    first_name = None
-    last_name = None
-    email = None
-    if customer_type == 'CORPORATE' and corporates_df is not None and len(corporates_df) > 0:
-        corp = corporates_df.sample(1).iloc[0]
-        customer_id=corp['company_id']
-        company_id = corp['company_id']
-        email = corp['company_email']
-        age = None
-        age_group = None
-        gender=None
-        first_name = None
-        last_name = None
-        country = corp['country']
-        registration_date = corp['registration_date']
-        
-    else:
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        email = fake.email()
-        # Generate more realistic age group based on actual age
-        age = fake.random_int(min=18, max=80)
-        if age <= 25:
-            age_group = '18-25'
-        elif age <= 35:
-            age_group = '26-35'
-        elif age <= 45:
-            age_group = '36-45'
-        elif age <= 55:
-            age_group = '46-55'
-        elif age <= 65:
-            age_group = '56-65'
-        else:
-            age_group = '65+'
-        
-        # Generate gender with realistic distribution
-        gender = random.choices(['M', 'F', 'Other'], weights=[49, 49, 2])[0]
-        
-        # Generate country with realistic distribution (more US customers)
-        country = random.choices(
-            ['US', 'CA', 'UK', 'AU', 'DE', 'FR', 'JP', 'SG', 'NL', 'CH'],
-            weights=[60, 10, 8, 5, 4, 4, 3, 2, 2, 2]
-        )[0]
-        registration_date= fake.date_between(start_date='-10y', end_date='today').strftime('%Y-%m-%d')
-        customer_id = str(uuid.uuid4().hex[:10].upper())
-        company_id = None
-
-    return {
-        'customer_id': customer_id,
-        'first_name': first_name,
-        'last_name': last_name,
-        'email': email,
-        'gender': gender,
-        'age_group': age_group,
-        'country': country,
-        'registration_date': registration_date,
-        'customer_tier': random.choices(['Bronze', 'Silver', 'Gold', 'Platinum'], weights=[40, 30, 20, 10])[0],
-        'risk_tolerance': random.choices(['Conservative', 'Moderate', 'Aggressive'], weights=[30, 50, 20])[0],
-        'customer_type': customer_type,
-        'company_id': company_id,
-        'load_timestamp': datetime.now(UTC_PLUS_7)
-    }
+    if corporates:
+        for customer in customers:
+            if customer['customer_type'] != 'CORPORATE':
+                continue
+            corp = _random.choice(corporates)
+            customer.update(
+                customer_id=corp['company_id'],
+                company_id=corp['company_id'],
+                email=corp['company_email'],
+                first_name=None,
+                last_name=None,
+                gender=None,
+                age_group=None,
+                country=corp['country'],
+                registration_date=corp['registration_date'],
+            )
+
+    return customers
+
+
+TRANSACTION_DTYPE = np.dtype([
+    ('transaction_id', 'U36'),
+    ('customer_id', 'U12'),
+    ('asset_type', 'U6'),
+    ('asset_symbol', 'U16'),
+    ('transaction_type', 'U4'),
+    ('quantity', 'f8'),
+    ('price_per_unit', 'f8'),
+    ('transaction_amount', 'f8'),
+    ('fee_amount', 'f8'),
+    # Wall-clock UTC+7 time; formatted with the offset at send time
+    ('transaction_timestamp', 'datetime64[us]'),
+    ('data_date', 'U10'),
+    ('customer_tier', 'U8'),
+    ('customer_risk_tolerance', 'U12'),
+    ('customer_type', 'U9'),
+])
+
+STOCK_LOTS_BY_SEGMENT = {
+    'CORPORATE': STOCK_LOTS_CORPORATE,  # 100 → 5000
+    'GOLD_PLATINUM': STOCK_LOTS_GOLD_PLATINUM,  # 100 → 1000
+    'SILVER': STOCK_LOTS_SILVER,  # 100 → 500
+    'BRONZE': STOCK_LOTS_BRONZE,  # 100 → 300
+}
+# ((btc/eth low, high), (other coins low, high)) per customer segment
+CRYPTO_QUANTITY_BY_SEGMENT = {
+    'CORPORATE': ((1, 50), (1000, 100000)),
+    'GOLD_PLATINUM': ((0.1, 5), (100, 10000)),
+    'SILVER': ((0.01, 1), (10, 1000)),
+    'BRONZE': ((0.001, 0.1), (1, 100)),
+}
 
 
-def generate_stock_transaction(customer: Dict, stock_tickers: List[str], start_date: datetime, end_date: datetime) -> Dict:
-    """Generate a single stock transaction."""
-    ticker = random.choice(stock_tickers)
-    transaction_type = random.choice(TRANSACTION_TYPES)
-    
-    # Generate realistic price
-    if ticker in STOCK_PRICE_RANGES:
-        min_price, max_price = STOCK_PRICE_RANGES[ticker]
-        price_per_unit = round(random.uniform(min_price, max_price), 2)
-    else:
-        price_per_unit = round(random.uniform(10, 500), 2)
-    
-    # Generate quantity based on customer tier
-    if customer['customer_type'] == 'CORPORATE':
-        lots = random.choices(
-            [1, 2, 5, 10, 20, 50],  # 100 → 5000
-            weights=[10, 15, 25, 25, 15, 10]
-        )[0]
-    elif customer['customer_tier'] in ['Gold', 'Platinum']:
-        lots = random.choices(
-            [1, 2, 3, 5, 10],  # 100 → 1000
-            weights=[25, 25, 20, 20, 10]
-        )[0]
-    elif customer['customer_tier'] == 'Silver':
-        lots = random.choices(
-            [1, 2, 3, 5],  # 100 → 500
-            weights=[40, 30, 20, 10]
-        )[0]
-    else:  # Bronze
-        lots = random.choices(
-            [1, 2, 3],  # 100 → 300
-            weights=[60, 30, 10]
-        )[0]
-
-    quantity = lots * 100
-
-    if transaction_type == 'SELL':
-        sell_lots = max(1, int(lots * random.uniform(0.5, 1.0)))
-        quantity = sell_lots * 100
-        price_per_unit *= random.uniform(0.995, 1.0)
-
-    timestamp = fake.date_time_between(start_date=start_date, end_date=end_date)
-    # Make timestamp timezone-aware (UTC+7)
-    if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=UTC_PLUS_7)
-    else:
-        timestamp = timestamp.astimezone(UTC_PLUS_7)
-    
-    transaction_amount = round(price_per_unit * quantity, 2)
-    fee_percentage = random.uniform(0.001, 0.01)
-    fee_amount = round(transaction_amount * fee_percentage, 2)
-    
-    return {
-        'transaction_id': str(uuid.uuid4()),
-        'customer_id': customer['customer_id'],
-        'asset_type': 'STOCK',
-        'asset_symbol': ticker,
-        'transaction_type': transaction_type,
-        'quantity': quantity,
-        'price_per_unit': round(price_per_unit, 2),
-        'transaction_amount': transaction_amount,
-        'fee_amount': fee_amount,
-        'transaction_timestamp': timestamp,
-        'data_date': timestamp.strftime('%Y-%m-%d'),
-        'customer_tier': customer['customer_tier'],
-        'customer_risk_tolerance': customer['risk_tolerance'],
-        'customer_type': customer['customer_type'],        
-        'data_source': 'KAFKA_PRODUCER',
-        'load_timestamp': datetime.now(UTC_PLUS_7)
+def price_bounds(symbols: np.ndarray, ranges: Dict, default: tuple) -> tuple:
+    """Low/high price arrays for symbols, looking each distinct symbol up once."""
+    unique_symbols, inverse = np.unique(symbols, return_inverse=True)
+    bounds = np.array([ranges.get(symbol, default) for symbol in unique_symbols], dtype=float).reshape(-1, 2)
+    return bounds[inverse, 0], bounds[inverse, 1]
+
+
+def generate_transactions_batch(
+    customers: List[Dict],
+    stock_tickers: List[str],
+    crypto_symbols: List[str],
+    num_transactions: int,
+    start_date: datetime,
+    end_date: datetime,
+) -> np.ndarray:
+    """Generate a batch of stock and crypto transactions as one TRANSACTION_DTYPE record array.
+    Every column is drawn for the whole batch at once; dicts are only built at send time
+    (see transaction_records)."""
+    n = num_transactions
+    txns = np.empty(n, dtype=TRANSACTION_DTYPE)
+    if n == 0:
+        return txns
+
+    picked = [customers[i] for i in _rng.integers(0, len(customers), size=n).tolist()]
+    txns['customer_id'] = [c['customer_id'] for c in picked]
+    txns['customer_tier'] = [c['customer_tier'] for c in picked]
+    txns['customer_risk_tolerance'] = [c['risk_tolerance'] for c in picked]
+    txns['customer_type'] = [c['customer_type'] for c in picked]
+
+    tiers = txns['customer_tier']
+    corporate = txns['customer_type'] == 'CORPORATE'
+    gold_platinum = ~corporate & np.isin(tiers, ['Gold', 'Platinum'])
+    silver = ~corporate & ~gold_platinum & (tiers == 'Silver')
+    segments = {
+        'CORPORATE': corporate,
+        'GOLD_PLATINUM': gold_platinum,
+        'SILVER': silver,
+        'BRONZE': ~(corporate | gold_platinum | silver),
     }
 
-
-def generate_crypto_transaction(customer: Dict, crypto_symbols: List[str], start_date: datetime, end_date: datetime) -> Dict:
-    """Generate a single crypto transaction."""
-    symbol = random.choice(crypto_symbols)
-    transaction_type = random.choice(TRANSACTION_TYPES)
-    
-    # Generate realistic price
-    if symbol in CRYPTO_PRICE_RANGES:
-        min_price, max_price = CRYPTO_PRICE_RANGES[symbol]
-        price_per_unit = round(random.uniform(min_price, max_price), 8)
-    else:
-        price_per_unit = round(random.uniform(0.01, 100), 8)
-    
-    # Generate quantity based on customer tier
-    if customer['customer_type'] == 'CORPORATE':
-        quantity = (
-            round(random.uniform(1, 50), 6)
-            if symbol in ['btc', 'eth']
-            else round(random.uniform(1000, 100000), 2)
-        )
-    elif customer['customer_tier'] in ['Gold', 'Platinum']:
-        quantity = (
-            round(random.uniform(0.1, 5), 6)
-            if symbol in ['btc', 'eth']
-            else round(random.uniform(100, 10000), 2)
-        )
-    elif customer['customer_tier'] == 'Silver':
-        quantity = (
-            round(random.uniform(0.01, 1), 6)
-            if symbol in ['btc', 'eth']
-            else round(random.uniform(10, 1000), 2)
+    is_stock = _rng.random(n) < 0.5
+    is_crypto = ~is_stock
+    is_sell = _rng.random(n) < 0.5
+    txns['asset_type'] = np.where(is_stock, 'STOCK', 'CRYPTO')
+    txns['transaction_type'] = np.where(is_sell, 'SELL', 'BUY')
+
+    price_per_unit = np.empty(n)
+    quantity = np.empty(n)
+    fee_percentage = np.empty(n)
+
+    # Stocks: market price, lots of 100 shares, 0.1% – 1% fee
+    n_stock = int(is_stock.sum())
+    tickers = _rng.choice(stock_tickers, size=n_stock)
+    low, high = price_bounds(tickers, STOCK_PRICE_RANGES, (10, 500))
+    price_per_unit[is_stock] = np.round(_rng.uniform(low, high), 2)
+    lots = np.empty(n_stock, dtype=np.int64)
+    for segment, mask in segments.items():
+        choices, cum = STOCK_LOTS_BY_SEGMENT[segment]
+        mask = mask[is_stock]
+        picks = np.searchsorted(cum, _rng.random(int(mask.sum())) * cum[-1], side='right')
+        lots[mask] = np.asarray(choices)[picks]
+    # SELL trades are often smaller
+    stock_sell = is_sell[is_stock]
+    sell_lots = np.maximum(1, (lots * _rng.uniform(0.5, 1.0, size=n_stock)).astype(np.int64))
+    quantity[is_stock] = np.where(stock_sell, sell_lots, lots) * 100
+    fee_percentage[is_stock] = _rng.uniform(0.001, 0.01, size=n_stock)
+
+    # Crypto: market price (8 dp), size by segment and coin, 0.1% – 0.5% fee
+    n_crypto = n - n_stock
+    symbols = _rng.choice(crypto_symbols, size=n_crypto)
+    low, high = price_bounds(symbols, CRYPTO_PRICE_RANGES, (0.01, 100))
+    price_per_unit[is_crypto] = np.round(_rng.uniform(low, high), 8)
+    major = np.isin(symbols, ['btc', 'eth'])
+    coins = np.empty(n_crypto)
+    for segment, mask in segments.items():
+        (major_low, major_high), (other_low, other_high) = CRYPTO_QUANTITY_BY_SEGMENT[segment]
+        mask = mask[is_crypto]
+        size = int(mask.sum())
+        coins[mask] = np.where(
+            major[mask],
+            np.round(_rng.uniform(major_low, major_high, size=size), 6),
+            np.round(_rng.uniform(other_low, other_high, size=size), 2),
         )
-    else:  # Bronze
-        quantity = (
-            round(random.uniform(0.001, 0.1), 6)
-            if symbol in ['btc', 'eth']
-            else round(random.uniform(1, 100), 2)
-        )
-
-    # SELL transactions typically smaller & discounted
-    if transaction_type == 'SELL':
-        quantity *= random.uniform(0.5, 1.0)
-        price_per_unit *= random.uniform(0.995, 1.0)
-
-    quantity = round(max(quantity, 0.000001), 6)
-
-    timestamp = fake.date_time_between(start_date=start_date, end_date=end_date)
-    # Make timestamp timezone-aware (UTC+7)
-    if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=UTC_PLUS_7)
-    else:
-        timestamp = timestamp.astimezone(UTC_PLUS_7)
-    
-    transaction_amount = round(price_per_unit * quantity, 2)
-    fee_percentage = random.uniform(0.001, 0.005)
-    fee_amount = round(transaction_amount * fee_percentage, 2)
-    
-    return {
-        'transaction_id': str(uuid.uuid4()),
-        'customer_id': customer['customer_id'],
-        'asset_type': 'CRYPTO',
-        'asset_symbol': symbol.upper(),
-        'transaction_type': transaction_type,
-        'quantity': quantity,
-        'price_per_unit': price_per_unit,
-        'transaction_amount': transaction_amount,
-        'fee_amount': fee_amount,
-        'transaction_timestamp': timestamp,
-        'data_date': timestamp.strftime('%Y-%m-%d'),
-        'customer_tier': customer['customer_tier'],
-        'customer_risk_tolerance': customer['risk_tolerance'],
-        'customer_type': customer['customer_type'],        
-        'data_source': 'KAFKA_PRODUCER',
-        'load_timestamp': datetime.now(UTC_PLUS_7)
-    }
+    crypto_sell = is_sell[is_crypto]
+    coins[crypto_sell] *= _rng.uniform(0.5, 1.0, size=int(crypto_sell.sum()))
+    np.maximum(coins, 0.000001, out=coins)
+    quantity[is_crypto] = np.round(coins, 6, out=coins)
+    fee_percentage[is_crypto] = _rng.uniform(0.001, 0.005, size=n_crypto)
+
+    symbol_column = np.empty(n, dtype=TRANSACTION_DTYPE['asset_symbol'])
+    symbol_column[is_stock] = tickers
+    symbol_column[is_crypto] = np.char.upper(symbols)
+    txns['asset_symbol'] = symbol_column
+
+    # SELL transactions are slightly discounted
+    price_per_unit[is_sell] *= _rng.uniform(0.995, 1.0, size=int(is_sell.sum()))
+    # Round whole columns in place
+    transaction_amount = price_per_unit * quantity
+    np.round(transaction_amount, 2, out=transaction_amount)
+    fee_amount = transaction_amount * fee_percentage
+    np.round(fee_amount, 2, out=fee_amount)
+    price_per_unit[is_stock] = np.round(price_per_unit[is_stock], 2)
+    txns['quantity'] = quantity
+    txns['price_per_unit'] = price_per_unit
+    txns['transaction_amount'] = transaction_amount
+    txns['fee_amount'] = fee_amount
+
+    # Uniform timestamps in [start_date, end_date), as UTC+7 wall-clock time
+    start_local = np.datetime64(start_date.astimezone(UTC_PLUS_7).replace(tzinfo=None), 'us')
+    span_us = int((end_date - start_date).total_seconds() * 1_000_000)
+    timestamps = start_local + _rng.integers(0, max(span_us, 1), size=n).astype('timedelta64[us]')
+    txns['transaction_timestamp'] = timestamps
+    txns['data_date'] = timestamps.astype('datetime64[D]').astype(str)
+
+    txns['transaction_id'] = random_uuids(n, _rng)
+    return txns
+
+
+def transaction_records(txns: np.ndarray, load_ts: datetime) -> List[Dict]:
+    """Turn a TRANSACTION_DTYPE array into the message dicts sent to Kafka.
+    Conversion is column by column: each field is unboxed with one tolist() call and the
+    timestamps are formatted as ISO-8601 strings with the UTC+7 offset in one numpy call,
+    so no per-row datetime objects are created."""
+    names = txns.dtype.names
+    columns = {name: txns[name].tolist() for name in names}
+    columns['transaction_timestamp'] = np.char.add(
+        np.datetime_as_string(txns['transaction_timestamp'], unit='us'), '+07:00'
+    ).tolist()
+    # quantity is a float column for both asset types; stock lots are whole shares and
+    # go out as JSON integers (300, not 300.0), as consumers have always received them
+    columns['quantity'] = [
+        int(quantity) if is_stock else quantity
+        for quantity, is_stock in zip(columns['quantity'], (txns['asset_type'] == 'STOCK').tolist())
+    ]
+    return [
+        {**dict(zip(names, row)), 'data_source': 'KAFKA_PRODUCER', 'load_timestamp': load_ts}
+        for row in zip(*(columns[name] for name in names))
+    ]
 
 
 # ==============================================================
 # 7. Main
 # ==============================================================
 
+def send_batch(producer: KafkaProducer, topic: str, records: List[Dict], key_field: str) -> None:
+    """Serialize a whole batch of records up front, then enqueue the ready bytes.
+    The producer is built without a value_serializer, so send() only appends."""
+    payloads = [json_serialize_value(record) for record in records]
+    for record, payload in zip(records, payloads):
+        producer.send(topic, key=record[key_field], value=payload)
+
+
 def main():
     producer = KafkaProducer(
         bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
         key_serializer=lambda k: str(k).encode("utf-8"),
-        value_serializer=lambda v: json.dumps(json_serialize_value(v), default=json_serializer).encode("utf-8"),
+        # Values are serialized per batch by send_batch and handed over as bytes
+        # Let sends accumulate into per-partition batches instead of one request per record,
+        # and compress each batch as a whole (JSON records repeat the same keys)
+        linger_ms=100,
+        batch_size=1 << 20,
+        compression_type="zstd",
+        max_in_flight_requests_per_connection=5,
+        acks=1,
     )
 
     stocks, cryptos = load_asset_lists()
 
     # Maintain state across batches
-    corporates_df = pd.DataFrame()  # Store all generated corporates
+    all_corporates = []  # Store all generated corporates (append-only, no frame copies)
     customers = []  # Store all generated customers
     
     start = datetime.now(UTC_PLUS_7) - timedelta(days=DAYS_BACK)
@@ -477,80 +520,60 @@ def main():
         
         # Step 1: Generate corporates first (they don't depend on anything)
         logger.info("=" * 60)
-        logger.info(f"Starting new batch at {datetime.now(UTC_PLUS_7).strftime('%Y-%m-%d %H:%M:%S')}")
+        # One clock read per batch, used as load_timestamp for every record in it
+        batch_load_ts = datetime.now(UTC_PLUS_7)
+        logger.info(f"Starting new batch at {batch_load_ts.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        new_corporates_df = generate_corporate_demographics(NEW_CORPORATES_BATCH_SIZE)
-        for _, corp in new_corporates_df.iterrows():
-            corp_dict = corp.to_dict()
-            # Ensure load_timestamp is in UTC+7 (pandas might normalize timezone)
-            if 'load_timestamp' in corp_dict:
-                ts = corp_dict['load_timestamp']
-                if isinstance(ts, pd.Timestamp):
-                    # If it's a pandas Timestamp, ensure it's in UTC+7
-                    if ts.tz is None:
-                        # Naive timestamp, assume it's already UTC+7 time
-                        corp_dict['load_timestamp'] = ts.to_pydatetime().replace(tzinfo=UTC_PLUS_7)
-                    elif str(ts.tz) == 'UTC':
-                        # Convert from UTC to UTC+7
-                        ts_utc7 = ts.tz_convert('Asia/Bangkok')
-                        corp_dict['load_timestamp'] = ts_utc7.to_pydatetime()
-                    else:
-                        # Already in correct timezone, just convert to datetime
-                        corp_dict['load_timestamp'] = ts.to_pydatetime()
-            producer.send(KAFKA_TOPIC_CORPORATES, key=str(corp["company_id"]), value=corp_dict)
-            logger.info(f"corporate {corp['company_id']} produced")
+        new_corporates = generate_corporate_demographics(NEW_CORPORATES_BATCH_SIZE, load_ts=batch_load_ts)
+        # Send the generated dicts directly: load_timestamp is already a UTC+7 datetime
+        send_batch(producer, KAFKA_TOPIC_CORPORATES, new_corporates, "company_id")
+        logger.info("produced %d corporates", len(new_corporates))
         
-        # Update corporates_df to include new ones
-        if corporates_df.empty:
-            corporates_df = new_corporates_df
-        else:
-            corporates_df = pd.concat([corporates_df, new_corporates_df], ignore_index=True)
-        producer.flush()
+        # Update all_corporates to include new ones
+        all_corporates.extend(new_corporates)
         
         # Step 2: Generate customers (they depend on corporates)
-        new_customers = [generate_customer(corporates_df) for _ in range(NEW_CUSTOMERS_BATCH_SIZE)]
-        for c in new_customers:
-            # Use customer_id as key (company_id is None for personal customers)
-            producer.send(KAFKA_TOPIC_CUSTOMERS, key=c["customer_id"], value=c)
-            logger.info(f"customer {c['customer_id']} produced")
-            customers.append(c)  # Add to the list for transaction generation
-        producer.flush()
+        new_customers = generate_customers_batch(NEW_CUSTOMERS_BATCH_SIZE, all_corporates, load_ts=batch_load_ts)
+        # Use customer_id as key (company_id is None for personal customers)
+        send_batch(producer, KAFKA_TOPIC_CUSTOMERS, new_customers, "customer_id")
+        customers.extend(new_customers)  # Add to the list for transaction generation
+        logger.info("produced %d customers", len(new_customers))
         
         # Step 3: Generate transactions (they depend on customers)
         # Generate transactions for both personal and corporate customers
-        personal_transactions = []
-        corporate_transactions = []
-        
-        for _ in range(NUM_TRANSACTIONS_PER_BATCH):
-            if not customers:
-                break
-            
-            customer = random.choice(customers)
-            txn_fn = random.choice([generate_stock_transaction, generate_crypto_transaction])
-
-            txn = txn_fn(
-                customer,
-                stocks if txn_fn == generate_stock_transaction else cryptos,
-                start,
-                end,
-            )
+        txns = generate_transactions_batch(
+            customers, stocks, cryptos, NUM_TRANSACTIONS_PER_BATCH if customers else 0, start, end,
+        )
+        # Sorted by key so records for the same partition are appended back to back
+        txns = txns[np.argsort(txns['customer_id'], kind='stable')]
+        is_corporate = txns['customer_type'] == 'CORPORATE'
 
-            if customer["customer_type"] == "CORPORATE":
-                corporate_transactions.append(txn)
-            else:
-                personal_transactions.append(txn)
-        
         # Send personal transactions
-        for txn in personal_transactions:
-            producer.send(KAFKA_TOPIC_TRANSACTION_PERSONAL, key=txn["customer_id"], value=txn)
-            logger.info(f"transaction_personal {txn['transaction_id']} produced")
-        
+        send_batch(
+            producer, KAFKA_TOPIC_TRANSACTION_PERSONAL,
+            transaction_records(txns[~is_corporate], batch_load_ts), "customer_id",
+        )
+
         # Send corporate transactions
-        for txn in corporate_transactions:
-            producer.send(KAFKA_TOPIC_TRANSACTION_CORPORATE, key=txn["customer_id"], value=txn)
-            logger.info(f"transaction_corporate {txn['transaction_id']} produced")
+        send_batch(
+            producer, KAFKA_TOPIC_TRANSACTION_CORPORATE,
+            transaction_records(txns[is_corporate], batch_load_ts), "customer_id",
+        )
+        logger.info(
+            "produced %d personal / %d corporate transactions",
+            int((~is_corporate).sum()), int(is_corporate.sum()),
+        )
         
+        # One flush per batch: everything above goes out in linger-sized requests
         producer.flush()
+        if logger.isEnabledFor(logging.DEBUG):
+            metrics = producer.metrics().get("producer-metrics", {})
+            logger.debug(
+                "record-send-rate=%.1f/s request-size-avg=%.0fB compression-rate-avg=%.3f",
+                metrics.get("record-send-rate", 0.0),
+                metrics.get("request-size-avg", 0.0),
+                metrics.get("compression-rate-avg", 0.0),
+            )
         
         # Update time window for transactions periodically
         start = datetime.now(UTC_PLUS_7) - timedelta(days=DAYS_BACK)
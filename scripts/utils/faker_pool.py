@@ -0,0 +1,102 @@
+"""
+Pre-generated pools of Faker values, bulk random IDs and weighted picks.
+Each Faker call dispatches through the provider registry and locale lookup;
+the generators draw many names/addresses per batch (and the Kafka producer
+runs forever), so each provider is called FAKER_POOL_SIZE times once per
+process and later draws just pick from the pool.
+Call seed() before the first draw to make pools, draws and IDs reproducible.
+"""
+
+import os
+import random
+import re
+import uuid
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from faker import Faker
+
+# 5000 values per provider keeps the one-off pool build to a fraction of a second per
+# provider. Values that must be unique (personal emails) are derived per record with
+# personal_email() instead of drawn from a pool.
+FAKER_POOL_SIZE = int(os.getenv("FAKER_POOL_SIZE", "5000"))
+
+_fake = Faker()
+# Private stdlib RNG behind the pool draws and weighted_choice, so seed() does not touch
+# the global `random` state
+_random = random.Random()
+
+_PROVIDERS = {
+    "company": _fake.company,
+    # Normalized once at pool build time instead of on every draw
+    "address": lambda: _fake.address().replace("\n", ", "),
+    "domain_name": _fake.domain_name,
+    "first_name": _fake.first_name,
+    "last_name": _fake.last_name,
+    "free_email_domain": _fake.free_email_domain,
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def seed(value: int) -> None:
+    """Seed Faker and the pool draws. Pools are built on first use, so call this first."""
+    _fake.seed_instance(value)
+    _random.seed(value)
+
+
+@lru_cache(maxsize=None)
+def _pool(provider: str) -> Tuple[str, ...]:
+    """Build the pool for a provider on first use."""
+    generate = _PROVIDERS[provider]
+    return tuple(generate() for _ in range(FAKER_POOL_SIZE))
+
+
+def fake_value(provider: str) -> str:
+    """Draw one value for a Faker provider from its pool."""
+    return _random.choice(_pool(provider))
+
+
+def fake_values(provider: str, k: int) -> List[str]:
+    """Draw k values (with replacement) for a Faker provider from its pool."""
+    return _random.choices(_pool(provider), k=k)
+
+
+def _random_bytes(k: int, rng: Optional[np.random.Generator]) -> bytes:
+    return rng.bytes(k) if rng is not None else os.urandom(k)
+
+
+def personal_email(first_name: str, last_name: str, unique_id: str) -> str:
+    """Build a per-record email from the person's name and their unique ID (pooled domain),
+    so emails do not repeat the way a with-replacement pool draw would."""
+    local = ".".join(_NON_ALNUM.sub("", part.lower()) for part in (first_name, last_name, unique_id[:8]))
+    return f"{local}@{fake_value('free_email_domain')}"
+
+
+def random_hex_ids(n: int, width: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """Return n random upper-case hex IDs of `width` characters from a single urandom read
+    (same shape as uuid.uuid4().hex[:width].upper(), without a syscall per ID).
+    If rng is given, the bytes come from it instead, so a seeded generator gives repeatable IDs."""
+    step = (width + 1) // 2 * 2
+    raw = _random_bytes(n * step // 2, rng).hex().upper()
+    return [raw[i:i + width] for i in range(0, n * step, step)]
+
+
+def random_uuids(n: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """Return n random version-4 UUID strings from a single urandom read (or from rng, if given)."""
+    raw = _random_bytes(16 * n, rng)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def cumulative_weights(weights: Sequence[float]) -> List[float]:
+    """Precompute cumulative weights for weighted_choice (do this once, at module level)."""
+    return list(accumulate(weights))
+
+
+def weighted_choice(labels: Sequence, cum_weights: List[float]):
+    """Equivalent of random.choices(labels, weights)[0] for precomputed cumulative weights,
+    without rebuilding the cumulative table on every call."""
+    return labels[bisect(cum_weights, _random.random() * cum_weights[-1])]
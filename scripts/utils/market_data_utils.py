@@ -4,13 +4,41 @@ This module provides helper functions for testing, validation, and data processi
 """
 
 import os
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import yfinance as yf
 
 from prefect import get_run_logger
+from dotenv import load_dotenv
+
+# Read .env once at import
+load_dotenv()
+
+# USDT pairs seen in the last full Binance 24hr listing, used to keep per-pair requests valid
+_binance_usdt_pairs: set = set()
+
+# Keep-alive HTTPS connections shared by every API call in this module
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# Connectivity probes must fail fast: same keep-alive pooling, but no retries/backoff
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.mount("https://", HTTPAdapter(max_retries=0))
+
+# Symbol list files at least this large are parsed with pandas instead of line by line
+LIST_FILE_VECTORIZE_MIN_BYTES = 64 * 1024
 
 
 def test_api_connectivity() -> Dict[str, bool]:
@@ -21,35 +49,33 @@ def test_api_connectivity() -> Dict[str, bool]:
         Dict[str, bool]: Dictionary with API names and their connectivity status
     """
     logger = get_run_logger()
-    results = {}
     
-    # Test Binance API
-    try:
-        response = requests.get("https://api.binance.com/api/v3/ping", timeout=10)
-        results['binance'] = response.status_code == 200
-        logger.info(f"Binance API: {'✅ Connected' if results['binance'] else '❌ Failed'}")
-    except Exception as e:
-        results['binance'] = False
-        logger.error(f"Binance API: ❌ Failed - {e}")
+    def ping(url: str) -> bool:
+        return _PROBE_SESSION.get(url, timeout=10).status_code == 200
     
-    # Test CoinGecko API
-    try:
-        response = requests.get("https://api.coingecko.com/api/v3/ping", timeout=10)
-        results['coingecko'] = response.status_code == 200
-        logger.info(f"CoinGecko API: {'✅ Connected' if results['coingecko'] else '❌ Failed'}")
-    except Exception as e:
-        results['coingecko'] = False
-        logger.error(f"CoinGecko API: ❌ Failed - {e}")
+    def ping_yfinance() -> bool:
+        # Test yfinance (by fetching a simple ticker)
+        return bool(yf.Ticker("AAPL").info)
     
-    # Test yfinance (by fetching a simple ticker)
-    try:
-        ticker = yf.Ticker("AAPL")
-        info = ticker.info
-        results['yfinance'] = bool(info)
-        logger.info(f"yfinance API: {'✅ Connected' if results['yfinance'] else '❌ Failed'}")
-    except Exception as e:
-        results['yfinance'] = False
-        logger.error(f"yfinance API: ❌ Failed - {e}")
+    probes = {
+        'binance': ("Binance", lambda: ping("https://api.binance.com/api/v3/ping")),
+        'coingecko': ("CoinGecko", lambda: ping("https://api.coingecko.com/api/v3/ping")),
+        'yfinance': ("yfinance", ping_yfinance),
+    }
+    
+    # Run the probes concurrently (the HTTP ones without retries): worst case is one
+    # timeout, not the sum of them
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {key: executor.submit(probe) for key, (_, probe) in probes.items()}
+        for key, future in futures.items():
+            label = probes[key][0]
+            try:
+                results[key] = future.result()
+                logger.info(f"{label} API: {'✅ Connected' if results[key] else '❌ Failed'}")
+            except Exception as e:
+                results[key] = False
+                logger.error(f"{label} API: ❌ Failed - {e}")
     
     return results
 
@@ -71,8 +97,16 @@ def validate_crypto_list(cryptolist_path: str = "data/cryptolist.txt") -> List[s
         return []
     
     try:
-        with open(cryptolist_path, 'r') as file:
-            cryptocurrencies = [line.strip().lower() for line in file.readlines() if line.strip()]
+        if os.path.getsize(cryptolist_path) >= LIST_FILE_VECTORIZE_MIN_BYTES:
+            # Large lists: strip/lower the whole column in vectorized string ops. Lines are
+            # split as-is (no CSV parsing), so NA-like symbols and commas survive exactly as
+            # on the line-by-line path
+            with open(cryptolist_path, 'r') as file:
+                symbols = pd.Series(file.read().split('\n'), dtype='string').str.strip().str.lower()
+            cryptocurrencies = symbols[symbols != ''].tolist()
+        else:
+            with open(cryptolist_path, 'r') as file:
+                cryptocurrencies = [line.strip().lower() for line in file if line.strip()]
         
         logger.info(f"Loaded {len(cryptocurrencies)} cryptocurrencies from {cryptolist_path}")
         return cryptocurrencies
@@ -95,27 +129,47 @@ def get_sample_crypto_data(symbols: List[str], limit: int = 5) -> pd.DataFrame:
     logger = get_run_logger()
     
     sample_symbols = symbols[:limit]
-    sample_data = []
+    frames = []
     
     # Test Binance API
     try:
-        response = requests.get("https://api.binance.com/api/v3/ticker/24hr", timeout=30)
-        if response.status_code == 200:
-            binance_data = response.json()
-            for ticker in binance_data:
-                symbol = ticker['symbol']
-                if symbol.endswith('USDT'):
-                    base_currency = symbol[:-4].lower()
-                    if base_currency in sample_symbols:
-                        sample_data.append({
-                            'symbol': symbol,
-                            'base_currency': base_currency,
-                            'price': float(ticker['lastPrice']),
-                            'source': 'binance',
-                            'timestamp': datetime.now().isoformat()
-                        })
-                        if len(sample_data) >= limit:
-                            break
+        # Ask for just the sample USDT pairs. Binance rejects the whole request if any pair
+        # is not listed, so drop the quote asset itself (USDTUSDT) and pairs missing from the
+        # last full listing; fall back to the full 24hr listing if it is still rejected.
+        pairs = [symbol.upper() + 'USDT' for symbol in sample_symbols if symbol.lower() != 'usdt']
+        if _binance_usdt_pairs:
+            pairs = [pair for pair in pairs if pair in _binance_usdt_pairs]
+        response = _SESSION.get(
+            "https://api.binance.com/api/v3/ticker/price",
+            params={'symbols': orjson.dumps(pairs).decode()},
+            timeout=30,
+        ) if pairs else None
+        if response is not None and response.status_code == 200:
+            tickers = pd.DataFrame(orjson.loads(response.content), columns=['symbol', 'price'])
+        elif pairs and not _binance_usdt_pairs:
+            response = _SESSION.get("https://api.binance.com/api/v3/ticker/24hr", timeout=30)
+            tickers = (
+                pd.DataFrame(orjson.loads(response.content), columns=['symbol', 'lastPrice'])
+                .rename(columns={'lastPrice': 'price'})
+                if response.status_code == 200 else None
+            )
+            if tickers is not None:
+                _binance_usdt_pairs.update(tickers.loc[tickers['symbol'].str.endswith('USDT'), 'symbol'])
+        else:
+            # No pairs left to ask for, or they were already checked against the full listing
+            tickers = None
+        if tickers is not None:
+            # Filter with vectorized string ops (a no-op for the per-pair response)
+            base_currency = tickers['symbol'].str[:-4].str.lower()
+            mask = tickers['symbol'].str.endswith('USDT') & base_currency.isin(sample_symbols)
+            matched = tickers.loc[mask].head(limit)
+            frames.append(pd.DataFrame({
+                'symbol': matched['symbol'].astype('string'),
+                'base_currency': base_currency[mask].head(limit).astype('string'),
+                'price': matched['price'].astype('float64'),
+                'source': 'binance',
+                'timestamp': datetime.now().isoformat(),
+            }))
     except Exception as e:
         logger.error(f"Error fetching sample Binance data: {e}")
     
@@ -127,34 +181,45 @@ def get_sample_crypto_data(symbols: List[str], limit: int = 5) -> pd.DataFrame:
             'vs_currencies': 'usd',
             'include_market_cap': 'true'
         }
-        response = requests.get("https://api.coingecko.com/api/v3/simple/price", params=params, timeout=30)
+        response = _SESSION.get("https://api.coingecko.com/api/v3/simple/price", params=params, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
+            # One list per column, each turned into a typed array once
+            coin_ids, prices, market_caps = [], [], []
             for coin_id, coin_data in data.items():
                 if 'usd' in coin_data:
-                    sample_data.append({
-                        'symbol': coin_id.upper(),
-                        'base_currency': coin_id.lower(),
-                        'price': coin_data['usd'],
-                        'market_cap': coin_data.get('usd_market_cap'),
-                        'source': 'coingecko',
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    coin_ids.append(coin_id)
+                    prices.append(coin_data['usd'])
+                    market_caps.append(coin_data.get('usd_market_cap'))
+            coin_ids = pd.Series(coin_ids, dtype='string')
+            frames.append(pd.DataFrame({
+                'symbol': coin_ids.str.upper(),
+                'base_currency': coin_ids.str.lower(),
+                'price': np.fromiter(prices, dtype=np.float64, count=len(prices)),
+                'source': 'coingecko',
+                'timestamp': datetime.now().isoformat(),
+                'market_cap': pd.array(market_caps, dtype='Float64'),
+            }))
     except Exception as e:
         logger.error(f"Error fetching sample CoinGecko data: {e}")
     
-    df = pd.DataFrame(sample_data)
+    frames = [frame for frame in frames if not frame.empty]
+    # Categorize after concat: frames with differing categories would concat to object
+    df = pd.concat(frames, ignore_index=True).astype({'source': 'category'}) if frames else pd.DataFrame()
     logger.info(f"Fetched sample data for {len(df)} cryptocurrency records")
     return df
 
 
-def get_sample_stock_data(tickers: List[str], limit: int = 5) -> pd.DataFrame:
+def get_sample_stock_data(tickers: List[str], limit: int = 5, include_profile: bool = True) -> pd.DataFrame:
     """
     Fetch sample stock data for testing purposes.
     
     Args:
         tickers (List[str]): List of stock tickers
         limit (int): Maximum number of tickers to test
+        include_profile (bool): Fetch company name and sector via the heavy Ticker.info
+            scrape (default). Pass False to fetch only fast_info (market cap); company_name
+            is then the ticker and sector 'Unknown'
         
     Returns:
         pd.DataFrame: Sample stock data
@@ -162,29 +227,65 @@ def get_sample_stock_data(tickers: List[str], limit: int = 5) -> pd.DataFrame:
     logger = get_run_logger()
     
     sample_tickers = tickers[:limit]
-    sample_data = []
+    if not sample_tickers:
+        return pd.DataFrame()
     
-    for ticker in sample_tickers:
+    # Latest prices for every ticker in one batched download
+    try:
+        prices = yf.download(
+            sample_tickers, period="1d", group_by="ticker", threads=True, progress=False,
+        )
+    except Exception as e:
+        logger.error(f"Error downloading sample prices for {sample_tickers}: {e}")
+        prices = pd.DataFrame()
+    if isinstance(prices.columns, pd.MultiIndex):
+        closes = prices.xs('Close', axis=1, level=1)
+    elif 'Close' in prices:
+        closes = prices[['Close']].set_axis(sample_tickers[:1], axis=1)
+    else:
+        closes = pd.DataFrame()
+    
+    # One blocking HTTPS lookup per ticker, so fetch them concurrently. fast_info is a
+    # small quote lookup; .info scrapes several Yahoo endpoints and is only needed for
+    # company name and sector.
+    def fetch_info(ticker: str) -> Optional[Dict]:
         try:
             stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="1d")
-            
-            if not hist.empty:
-                latest_price = hist['Close'].iloc[-1]
-                sample_data.append({
-                    'ticker': ticker,
-                    'current_price': float(latest_price),
-                    'company_name': info.get('longName', ticker),
-                    'sector': info.get('sector', 'Unknown'),
-                    'market_cap': info.get('marketCap'),
-                    'source': 'yfinance',
-                    'timestamp': datetime.now().isoformat()
-                })
+            if include_profile:
+                return stock.info
+            return {'marketCap': stock.fast_info.market_cap}
         except Exception as e:
             logger.error(f"Error fetching sample data for {ticker}: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(sample_tickers))) as executor:
+        infos = dict(zip(sample_tickers, executor.map(fetch_info, sample_tickers)))
     
-    df = pd.DataFrame(sample_data)
+    # One list per column, each turned into a typed array once
+    found, prices, company_names, sectors, market_caps = [], [], [], [], []
+    for ticker in sample_tickers:
+        info = infos[ticker]
+        close = closes[ticker].dropna() if ticker in closes else None
+        if info is None or close is None or close.empty:
+            continue
+        found.append(ticker)
+        prices.append(float(close.iloc[-1]))
+        company_names.append(info.get('longName', ticker))
+        sectors.append(info.get('sector', 'Unknown'))
+        market_caps.append(info.get('marketCap'))
+    
+    if not found:
+        df = pd.DataFrame()
+    else:
+        df = pd.DataFrame({
+            'ticker': pd.array(found, dtype='string'),
+            'current_price': np.fromiter(prices, dtype=np.float64, count=len(prices)),
+            'company_name': pd.array(company_names, dtype='string'),
+            'sector': pd.array(sectors, dtype='string'),
+            'market_cap': pd.array(market_caps, dtype='Float64'),
+            'source': pd.Categorical(['yfinance'] * len(found)),
+            'timestamp': datetime.now().isoformat(),
+        })
     logger.info(f"Fetched sample data for {len(df)} stock records")
     return df
 
@@ -220,6 +321,14 @@ def validate_environment_variables() -> Dict[str, bool]:
     return results
 
 
+def _source_summary(df: pd.DataFrame, key_column: str) -> Tuple[Dict[str, int], int]:
+    """Rows per source and distinct key_column values, from one unsorted groupby."""
+    if df.empty:
+        return {}, 0
+    sources = df.groupby('source', sort=False, observed=True).size()
+    return {source: int(count) for source, count in sources.items()}, int(df[key_column].nunique())
+
+
 def generate_data_summary(crypto_df: pd.DataFrame, stock_df: pd.DataFrame) -> Dict:
     """
     Generate a summary of the ingested data.
@@ -233,14 +342,16 @@ def generate_data_summary(crypto_df: pd.DataFrame, stock_df: pd.DataFrame) -> Di
     """
     logger = get_run_logger()
     
+    crypto_sources, unique_crypto_symbols = _source_summary(crypto_df, 'base_currency')
+    stock_sources, unique_stock_tickers = _source_summary(stock_df, 'ticker')
     summary = {
         'crypto_records': len(crypto_df),
         'stock_records': len(stock_df),
         'total_records': len(crypto_df) + len(stock_df),
-        'crypto_sources': crypto_df['source'].value_counts().to_dict() if not crypto_df.empty else {},
-        'stock_sources': stock_df['source'].value_counts().to_dict() if not stock_df.empty else {},
-        'unique_crypto_symbols': crypto_df['base_currency'].nunique() if not crypto_df.empty else 0,
-        'unique_stock_tickers': stock_df['ticker'].nunique() if not stock_df.empty else 0,
+        'crypto_sources': crypto_sources,
+        'stock_sources': stock_sources,
+        'unique_crypto_symbols': unique_crypto_symbols,
+        'unique_stock_tickers': unique_stock_tickers,
         'timestamp': datetime.now().isoformat()
     }
     
@@ -250,7 +361,7 @@ def generate_data_summary(crypto_df: pd.DataFrame, stock_df: pd.DataFrame) -> Di
 
 def check_snowflake_connection() -> bool:
     """
-    Test Snowflake connection using manual connector.
+    Test Snowflake connection (through the shared warm connection when pooling is on).
     
     Returns:
         bool: True if connection successful, False otherwise
@@ -258,28 +369,13 @@ def check_snowflake_connection() -> bool:
     logger = get_run_logger()
     
     try:
-        import snowflake.connector
-        from dotenv import load_dotenv
+        from scripts.utils.snowflake_connector import get_snowflake_connection
         
-        load_dotenv()
-        
-        conn = snowflake.connector.connect(
-            account=os.getenv("SNOWFLAKE_ACCOUNT"),
-            user=os.getenv("SNOWFLAKE_USER"),
-            authenticator="SNOWFLAKE_JWT",
-            private_key_file=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PATH"),
-            private_key_file_pwd=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PWD"),
-            warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
-            database=os.getenv("SNOWFLAKE_DATABASE"),
-            schema=os.getenv("SNOWFLAKE_SCHEMA"),
-            role=os.getenv("SNOWFLAKE_ROLE"),
-        )
-        
-        cursor = conn.cursor()
-        cursor.execute("SELECT CURRENT_VERSION()")
-        result = cursor.fetchone()
-        
-        conn.close()
+        with get_snowflake_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT CURRENT_VERSION()")
+            result = cursor.fetchone()
+            cursor.close()
         
         logger.info(f"✅ Snowflake connection successful. Version: {result[0]}")
         return True
@@ -291,7 +387,7 @@ def check_snowflake_connection() -> bool:
 
 def check_snowflake_table_exists(table_name: str) -> bool:
     """
-    Check if a Snowflake table exists using manual connector.
+    Check if a Snowflake table exists (through the shared warm connection when pooling is on).
     
     Args:
         table_name (str): Full table name (database.schema.table)
@@ -302,10 +398,7 @@ def check_snowflake_table_exists(table_name: str) -> bool:
     logger = get_run_logger()
     
     try:
-        import snowflake.connector
-        from dotenv import load_dotenv
-        
-        load_dotenv()
+        from scripts.utils.snowflake_connector import get_snowflake_connection
         
         # Parse table name
         parts = table_name.split('.')
@@ -315,34 +408,21 @@ def check_snowflake_table_exists(table_name: str) -> bool:
         
         database, schema, table = parts
         
-        conn = snowflake.connector.connect(
-            account=os.getenv("SNOWFLAKE_ACCOUNT"),
-            user=os.getenv("SNOWFLAKE_USER"),
-            authenticator="SNOWFLAKE_JWT",
-            private_key_file=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PATH"),
-            private_key_file_pwd=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PWD"),
-            warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
-            database=os.getenv("SNOWFLAKE_DATABASE"),
-            schema=os.getenv("SNOWFLAKE_SCHEMA"),
-            role=os.getenv("SNOWFLAKE_ROLE"),
-        )
-        
-        cursor = conn.cursor()
-        
-        # Check if table exists
-        check_sql = f"""
-        SELECT COUNT(*) 
-        FROM INFORMATION_SCHEMA.TABLES 
-        WHERE TABLE_CATALOG = '{database}'
-        AND TABLE_SCHEMA = '{schema}' 
-        AND TABLE_NAME = '{table}'
+        # Check if table exists (bound parameters, no string-built SQL)
+        check_sql = """
+        SELECT 1
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_CATALOG = %s
+        AND TABLE_SCHEMA = %s
+        AND TABLE_NAME = %s
+        LIMIT 1
         """
         
-        cursor.execute(check_sql)
-        result = cursor.fetchone()
-        exists = result[0] > 0 if result else False
-        
-        conn.close()
+        with get_snowflake_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(check_sql, (database, schema, table))
+            exists = cursor.fetchone() is not None
+            cursor.close()
         
         status = '✅ Exists' if exists else '❌ Does not exist'
         logger.info(f"Table {table_name}: {status}")
@@ -4,18 +4,34 @@ This module provides a clean interface for MinIO operations.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
 from prefect import get_run_logger
 from prefect_aws.s3 import S3Bucket
 from dotenv import load_dotenv
 
+from scripts.utils.prefect_s3 import get_boto3_client_from_prefect_block
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
 MINIO_BLOCK_NAME = os.getenv("MINIO_BUCKET","minio-stock-bucket")
 
+# Multipart settings shared by the batch uploads
+TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=16, use_threads=True)
+
+
+@lru_cache(maxsize=1)
+def _load_s3_bucket(block_name: str) -> S3Bucket:
+    """Load the block from the Prefect API once per process (failures are not cached)."""
+    s3_bucket = S3Bucket.load(block_name)
+    get_run_logger().info(f"✅ Loaded S3Bucket block: {block_name}")
+    return s3_bucket
+
 
 def get_s3_bucket() -> Optional[S3Bucket]:
     """
@@ -27,9 +43,7 @@ def get_s3_bucket() -> Optional[S3Bucket]:
     logger = get_run_logger()
     
     try:
-        s3_bucket = S3Bucket.load(MINIO_BLOCK_NAME)
-        logger.info(f"✅ Loaded S3Bucket block: {MINIO_BLOCK_NAME}")
-        return s3_bucket
+        return _load_s3_bucket(MINIO_BLOCK_NAME)
     except Exception as e:
         logger.error(f"❌ Failed to load S3Bucket block: {e}")
         return None
@@ -65,6 +79,49 @@ def upload_file_to_minio(local_file_path: Path, minio_key: str) -> bool:
         return False
 
 
+def upload_files_to_minio(pairs: List[Tuple[Path, str]], max_concurrency: int = 16) -> bool:
+    """
+    Upload several local files to MinIO concurrently with one boto3 client.
+    
+    Args:
+        pairs (List[Tuple[Path, str]]): (local file path, MinIO object key) pairs
+        max_concurrency (int): Number of files uploaded at once
+        
+    Returns:
+        bool: True if every upload succeeded, False otherwise
+    """
+    logger = get_run_logger()
+    
+    missing = [str(path) for path, _ in pairs if not path.exists()]
+    if missing:
+        logger.error(f"❌ Local files not found: {missing}")
+        return False
+    
+    s3_bucket = get_s3_bucket()
+    if not s3_bucket:
+        return False
+    
+    client = get_boto3_client_from_prefect_block(s3_bucket)
+    bucket = s3_bucket.bucket_name
+    
+    def _upload(pair: Tuple[Path, str]) -> Optional[str]:
+        local_file_path, minio_key = pair
+        try:
+            client.upload_file(str(local_file_path), bucket, minio_key, Config=TRANSFER_CONFIG)
+            return None
+        except Exception as e:
+            return f"{minio_key}: {e}"
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pairs)))) as executor:
+        errors = [error for error in executor.map(_upload, pairs) if error]
+    
+    if errors:
+        logger.error(f"❌ Failed to upload {len(errors)}/{len(pairs)} files to MinIO: {errors}")
+        return False
+    logger.info(f"✅ Uploaded {len(pairs)} files to s3://{bucket}")
+    return True
+
+
 def download_file_from_minio(minio_key: str, local_file_path: Path) -> bool:
     """
     Download a file from MinIO to local path.
@@ -3,49 +3,55 @@ Snowflake connector utility for market data ingestion flows.
 This module provides a clean interface for Snowflake operations using manual connections.
 """
 
+import gzip
 import os
+import shutil
+import tempfile
 import snowflake.connector
 from contextlib import contextmanager
-from typing import Optional, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any
 from prefect import get_run_logger
 from dotenv import load_dotenv
 import pandas as pd
+
+from scripts.utils import snowflake_pool
+
 # Load environment variables
 load_dotenv()
 
+# Files at least this large are gzipped locally at level 1 before PUT; the connector's
+# own AUTO_COMPRESS uses the slow default level
+PUT_PRECOMPRESS_MIN_BYTES = 100 * 1024 * 1024
+
 
 @contextmanager
 def get_snowflake_connection():
     """
     Context manager for Snowflake connections.
     Automatically handles connection setup and cleanup.
+    Inside a snowflake_pool.warm_session() block (or with SNOWFLAKE_POOL_ENABLED=true),
+    the warm shared connection is yielded instead and left open for the next caller.
     
     Yields:
         snowflake.connector.SnowflakeConnection: Active Snowflake connection
     """
     conn = None
     logger = get_run_logger()
+    session = snowflake_pool.current_session()
     
     try:
-        conn = snowflake.connector.connect(
-            account=os.getenv("SNOWFLAKE_ACCOUNT"),
-            user=os.getenv("SNOWFLAKE_USER"),
-            authenticator="SNOWFLAKE_JWT",
-            private_key_file=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PATH"),
-            #private_key_file_pwd=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PWD"),
-            warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
-            database=os.getenv("SNOWFLAKE_DATABASE"),
-            schema=os.getenv("SNOWFLAKE_SCHEMA"),
-            role=os.getenv("SNOWFLAKE_ROLE"),
-        )
-        logger.info("✅ Snowflake connection established")
+        if session is not None:
+            conn = session.connection()
+        else:
+            conn = snowflake.connector.connect(**snowflake_pool.snowflake_connection_kwargs())
+            logger.info("✅ Snowflake connection established")
         yield conn
         
     except Exception as e:
         logger.error(f"❌ Snowflake connection failed: {e}")
         raise
     finally:
-        if conn:
+        if conn and session is None:
             conn.close()
             logger.info("🔌 Snowflake connection closed")
 
@@ -65,22 +71,29 @@ def create_table_if_not_exists(table_name: str, create_sql: str) -> bool:
     
     try:
         with get_snowflake_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(create_sql)
-            logger.info(f"✅ Table {table_name} created/verified successfully")
-            return True
+            with conn.cursor() as cursor:
+                cursor.execute(create_sql)
+                logger.info(f"✅ Table {table_name} created/verified successfully")
+                return True
     except Exception as e:
         logger.error(f"❌ Failed to create table {table_name}: {e}")
         return False
 
 
-def upload_file_to_stage(local_file_path: str, stage_name: str) -> bool:
+def staged_file_name(local_file_path: str) -> str:
+    """Name a local file gets on the stage after PUT (AUTO_COMPRESS appends .gz)."""
+    name = os.path.basename(local_file_path)
+    return name if name.endswith('.gz') else name + '.gz'
+
+
+def upload_file_to_stage(local_file_path: str, stage_name: str, parallel: int = 8) -> bool:
     """
     Upload a local file to Snowflake stage using PUT command.
     
     Args:
         local_file_path (str): Path to local file to upload
         stage_name (str): Stage name (schema.stage)
+        parallel (int): Number of threads PUT uses to upload chunks (1-99)
         
     Returns:
         bool: True if upload successful, False otherwise
@@ -94,55 +107,72 @@ def upload_file_to_stage(local_file_path: str, stage_name: str) -> bool:
         logger.error(f"❌ Local file not found: {local_file_path}")
         return False
     
+    tmp_dir = None
     try:
+        if os.path.getsize(local_file_path) >= PUT_PRECOMPRESS_MIN_BYTES and not local_file_path.endswith('.gz'):
+            # Same staged name (<file>.gz) as AUTO_COMPRESS would produce
+            tmp_dir = tempfile.mkdtemp(prefix="sf_put_")
+            gz_path = os.path.join(tmp_dir, staged_file_name(local_file_path))
+            with open(local_file_path, 'rb') as src, gzip.open(gz_path, 'wb', compresslevel=1) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            put_source, compression = gz_path, "SOURCE_COMPRESSION = GZIP"
+        else:
+            put_source, compression = local_file_path, "AUTO_COMPRESS = TRUE"
+        
         with get_snowflake_connection() as conn:
-            cursor = conn.cursor()
+            with conn.cursor() as cursor:
             
-            # PUT command
-            put_command = f"""
-            PUT file://{local_file_path} @{stage_name}
-            AUTO_COMPRESS = TRUE
-            """
-            cursor.execute(put_command)
+                # PUT command
+                put_command = f"""
+                PUT file://{put_source} @{stage_name}
+                PARALLEL = {max(1, min(int(parallel), 99))}
+                {compression}
+                """
+                cursor.execute(put_command)
 
-            # Get upload results (may return multiple rows)
-            rows = cursor.fetchall()
-            if not rows:
-                logger.warning("⚠️ PUT returned no result rows.")
-                return False
+                # Get upload results (may return multiple rows)
+                rows = cursor.fetchall()
+                if not rows:
+                    logger.warning("⚠️ PUT returned no result rows.")
+                    return False
 
-            def _norm_status(v):
-                try:
-                    if isinstance(v, (bytes, bytearray)):
-                        v = v.decode()
-                    return str(v or "").upper()
-                except Exception:
-                    return ""
+                def _norm_status(v):
+                    try:
+                        if isinstance(v, (bytes, bytearray)):
+                            v = v.decode()
+                        return str(v or "").upper()
+                    except Exception:
+                        return ""
 
-            statuses = [(r[0], r[1], _norm_status(r[6] if len(r) > 6 else None)) for r in rows]
-            non_ok = [s for s in statuses if s[2] not in ("UPLOADED", "SKIPPED")]
-            if non_ok:
-                logger.warning(f"⚠️ Upload failed or status unknown. Result rows: {statuses}")
-                return False
+                statuses = [(r[0], r[1], _norm_status(r[6] if len(r) > 6 else None)) for r in rows]
+                non_ok = [s for s in statuses if s[2] not in ("UPLOADED", "SKIPPED")]
+                if non_ok:
+                    logger.warning(f"⚠️ Upload failed or status unknown. Result rows: {statuses}")
+                    return False
 
-            uploaded = [s for s in statuses if s[2] == "UPLOADED"]
-            skipped = [s for s in statuses if s[2] == "SKIPPED"]
-            if uploaded:
-                logger.info(f"✅ Uploaded to stage: {[f'{u[0]} as {u[1]}' for u in uploaded]}")
-            if skipped:
-                logger.info(f"ℹ️ Skipped (already present): {[f'{s[0]} as {s[1]}' for s in skipped]}")
-            return True
+                uploaded = [s for s in statuses if s[2] == "UPLOADED"]
+                skipped = [s for s in statuses if s[2] == "SKIPPED"]
+                if uploaded:
+                    logger.info(f"✅ Uploaded to stage: {[f'{u[0]} as {u[1]}' for u in uploaded]}")
+                if skipped:
+                    logger.info(f"ℹ️ Skipped (already present): {[f'{s[0]} as {s[1]}' for s in skipped]}")
+                return True
                 
     except Exception as e:
         logger.error(f"❌ File upload failed: {e}")
         return False
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def copy_data_from_stage(
     table_name: str, 
     stage_path: str, 
     columns_list: str,
-    file_format: str = "CSV"
+    file_format: str = "CSV",
+    files: Optional[List[str]] = None,
+    purge: bool = False,
 ) -> bool:
     """
     Copy data from Snowflake stage to table using COPY INTO command.
@@ -152,6 +182,9 @@ def copy_data_from_stage(
         stage_path (str): Stage path with file pattern
         columns_list (str): Column list for COPY INTO
         file_format (str): File format (default: CSV)
+        files (Optional[List[str]]): Exact staged file names to load (see staged_file_name);
+            skips listing the stage path
+        purge (bool): Remove the loaded files from the stage afterwards
         
     Returns:
         bool: True if copy successful, False otherwise
@@ -160,29 +193,35 @@ def copy_data_from_stage(
     
     try:
         with get_snowflake_connection() as conn:
-            cursor = conn.cursor()
+            with conn.cursor() as cursor:
             
-            # COPY INTO command
-            copy_sql = f"""
-            COPY INTO {table_name} {columns_list}
-            FROM {stage_path}
-            FILE_FORMAT = (TYPE = {file_format}, SKIP_HEADER = 1, FIELD_OPTIONALLY_ENCLOSED_BY='"')
-            ON_ERROR = 'CONTINUE';
-            """
+                # COPY INTO command
+                files_clause = (
+                    "FILES = (" + ", ".join("'" + f.replace("'", "''") + "'" for f in files) + ")"
+                    if files else ""
+                )
+                copy_sql = f"""
+                COPY INTO {table_name} {columns_list}
+                FROM {stage_path}
+                {files_clause}
+                FILE_FORMAT = (TYPE = {file_format}, SKIP_HEADER = 1, FIELD_OPTIONALLY_ENCLOSED_BY='"')
+                ON_ERROR = 'CONTINUE'
+                PURGE = {'TRUE' if purge else 'FALSE'};
+                """
             
-            logger.info(f"Executing COPY INTO command for {table_name}")
-            cursor.execute(copy_sql)
-            results = cursor.fetchall()
+                logger.info(f"Executing COPY INTO command for {table_name}")
+                cursor.execute(copy_sql)
+                results = cursor.fetchall()
             
-            logger.info(f"COPY INTO results: {results}")
+                logger.info(f"COPY INTO results: {results}")
             
-            # Check if copy was successful
-            if results and any('LOADED' in str(row).upper() for row in results):
-                logger.info(f"✅ Successfully loaded data into {table_name}")
-                return True
-            else:
-                logger.warning(f"⚠️ No rows loaded or soft error occurred")
-                return False
+                # Check if copy was successful
+                if results and any('LOADED' in str(row).upper() for row in results):
+                    logger.info(f"✅ Successfully loaded data into {table_name}")
+                    return True
+                else:
+                    logger.warning(f"⚠️ No rows loaded or soft error occurred")
+                    return False
                 
     except Exception as e:
         logger.error(f"❌ COPY INTO failed: {e}")
@@ -203,56 +242,92 @@ def execute_query(query: str) -> List[Tuple[Any, ...]]:
     
     try:
         with get_snowflake_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
-            logger.info(f"✅ Query executed successfully, returned {len(results)} rows")
-            return results
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                results = cursor.fetchall()
+                logger.info(f"✅ Query executed successfully, returned {len(results)} rows")
+                return results
     except Exception as e:
         logger.error(f"❌ Query execution failed: {e}")
         raise
 
 
-def check_table_exists(table_name: str) -> bool:
+# Tables already seen to exist in this process. Only positive results are cached: a
+# missing table may be created by a later step, but an existing one is not dropped
+# mid-run (call refresh_metadata() if that changes).
+_existing_tables = set()
+
+TABLES_EXIST_SQL = """
+SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
+FROM INFORMATION_SCHEMA.TABLES
+WHERE (TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME) IN ({placeholders})
+"""
+
+
+def refresh_metadata() -> None:
+    """Forget cached table-existence results."""
+    _existing_tables.clear()
+
+
+def check_tables_exist(table_names: List[str]) -> Dict[str, bool]:
     """
-    Check if a Snowflake table exists.
+    Check whether several Snowflake tables exist with one INFORMATION_SCHEMA query.
     
     Args:
-        table_name (str): Full table name (database.schema.table)
+        table_names (List[str]): Full table names (database.schema.table)
         
     Returns:
-        bool: True if table exists, False otherwise
+        Dict[str, bool]: Existence per table name; malformed names and lookup
+        errors map to False
     """
     logger = get_run_logger()
     
-    try:
-        # Parse table name
-        parts = table_name.split('.')
+    results = {name: name in _existing_tables for name in table_names}
+    pending = {}
+    for name in table_names:
+        if results[name] or name in pending:
+            continue
+        parts = tuple(name.split('.'))
         if len(parts) != 3:
-            logger.error(f"Invalid table name format: {table_name}. Expected: database.schema.table")
-            return False
-        
-        database, schema, table = parts
-        
-        # Check if table exists
-        check_sql = f"""
-        SELECT COUNT(*) 
-        FROM INFORMATION_SCHEMA.TABLES 
-        WHERE TABLE_CATALOG = '{database}'
-        AND TABLE_SCHEMA = '{schema}' 
-        AND TABLE_NAME = '{table}'
-        """
-        
-        results = execute_query(check_sql)
-        exists = results[0][0] > 0 if results else False
-        
-        status = '✅ Exists' if exists else '❌ Does not exist'
-        logger.info(f"Table {table_name}: {status}")
-        return exists
-        
+            logger.error(f"Invalid table name format: {name}. Expected: database.schema.table")
+            continue
+        pending[name] = parts
+    if not pending:
+        return results
+    
+    try:
+        # Bound parameters, no string-built SQL: one (%s, %s, %s) row per table
+        query = TABLES_EXIST_SQL.format(placeholders=", ".join(["(%s, %s, %s)"] * len(pending)))
+        params = [value for parts in pending.values() for value in parts]
+        with get_snowflake_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                found = {tuple(row) for row in cursor.fetchall()}
     except Exception as e:
         logger.error(f"Error checking table existence: {e}")
-        return False
+        return results
+    
+    for name, parts in pending.items():
+        exists = parts in found
+        results[name] = exists
+        if exists:
+            _existing_tables.add(name)
+        status = '✅ Exists' if exists else '❌ Does not exist'
+        logger.info(f"Table {name}: {status}")
+    return results
+
+
+def check_table_exists(table_name: str) -> bool:
+    """
+    Check if a Snowflake table exists.
+    
+    Args:
+        table_name (str): Full table name (database.schema.table)
+        
+    Returns:
+        bool: True if table exists, False otherwise
+    """
+    return check_tables_exist([table_name])[table_name]
 
 def execute_non_query(query: str) -> bool:
     """
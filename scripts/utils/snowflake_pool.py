@@ -0,0 +1,119 @@
+"""
+Warm Snowflake connection reused across the subflows of one orchestrator run.
+Inside `with warm_session():` every get_snowflake_connection() call (in that
+thread and in tasks submitted from it) reuses one authenticated session instead
+of repeating the TLS + JWT handshake per operation; the session is closed when
+the block exits, so temp tables and ALTER SESSION settings stay within the run.
+SNOWFLAKE_POOL_ENABLED=true additionally shares one process-wide session
+outside of such runs (off by default).
+"""
+
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import snowflake.connector
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# A session used within this many seconds is assumed alive; only older ones get a SELECT 1 first
+PING_AFTER_IDLE_SECONDS = int(os.getenv("SNOWFLAKE_POOL_PING_AFTER_IDLE", "300"))
+
+
+def snowflake_connection_kwargs() -> dict:
+    """Connection arguments shared by pooled and one-off Snowflake connections."""
+    return dict(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        authenticator="SNOWFLAKE_JWT",
+        private_key_file=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PATH"),
+        # Only for encrypted keys; None lets the connector read an unencrypted key
+        private_key_file_pwd=os.getenv("SNOWFLAKE_PRIVATE_KEY_FILE_PWD") or None,
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+        database=os.getenv("SNOWFLAKE_DATABASE"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA"),
+        role=os.getenv("SNOWFLAKE_ROLE"),
+    )
+
+
+def _pre_ping(conn) -> bool:
+    """Return True if the cached connection is still usable."""
+    try:
+        conn.cursor().execute("SELECT 1").fetchone()
+        return True
+    except Exception:
+        return False
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class WarmSession:
+    """One lazily opened Snowflake connection, shared by the threads of a run."""
+
+    def __init__(self):
+        self._conn = None
+        self._last_used = 0.0
+        # Serializes connect/reconnect so concurrent subflows on a cold start open one session, not several
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """Return the warm connection, reconnecting if it was closed or fails the idle health check."""
+        with self._lock:
+            conn = self._conn
+            if conn is not None and (
+                conn.is_closed()
+                or (time.monotonic() - self._last_used >= PING_AFTER_IDLE_SECONDS and not _pre_ping(conn))
+            ):
+                # Close the dead session before replacing it so it is not leaked
+                _close_quietly(conn)
+                conn = self._conn = None
+            if conn is None:
+                conn = self._conn = snowflake.connector.connect(**snowflake_connection_kwargs())
+            self._last_used = time.monotonic()
+            return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                _close_quietly(self._conn)
+                self._conn = None
+
+
+_run_session: ContextVar[Optional[WarmSession]] = ContextVar("snowflake_run_session", default=None)
+_process_session = WarmSession()
+atexit.register(_process_session.close)
+
+
+def _process_pool_enabled() -> bool:
+    return os.getenv("SNOWFLAKE_POOL_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+
+
+def current_session() -> Optional[WarmSession]:
+    """The session get_snowflake_connection() should reuse, or None for a one-off connection."""
+    session = _run_session.get()
+    if session is None and _process_pool_enabled():
+        session = _process_session
+    return session
+
+
+@contextmanager
+def warm_session() -> Iterator[WarmSession]:
+    """Share one Snowflake session across everything run inside the block, closing it on exit."""
+    session = WarmSession()
+    token = _run_session.set(session)
+    try:
+        yield session
+    finally:
+        _run_session.reset(token)
+        session.close()
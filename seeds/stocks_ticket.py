@@ -11,8 +11,11 @@ tickers = [
     "MELI","ALGN","CDW","ASML","MRNA","SPLK","OKTA","ANSS","EBAY","KHC"
 ]
 
+# Drop repeated tickers, keeping first-seen order
+unique_tickers = list(dict.fromkeys(tickers))
+
 with open("stocklist.txt", "w") as f:
-    for ticker in tickers:
-        f.write(ticker + "\n")
+    f.write("\n".join(unique_tickers) + "\n")
 
-print("stocklist.txt created with 100 tickers.")
\ No newline at end of file
+print(f"stocklist.txt created with {len(unique_tickers)} tickers "
+      f"({len(tickers) - len(unique_tickers)} duplicates removed).")
\ No newline at end of file